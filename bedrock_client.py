@@ -3,24 +3,164 @@
 Este cliente se conecta al Bedrock Gateway usando el protocolo MCP
 sobre HTTP/SSE, permitiendo a agentes remotos acceder a múltiples
 modelos de Bedrock de forma transparente.
+
+Dependencias: mcp y cachetools (orjson es opcional).
 """
 
 import asyncio
+import copy
+import hashlib
+import json
 import logging
-from typing import Dict, Any, Optional
+import os
+import time
+from typing import Dict, Any, AsyncIterator, Optional, Tuple
 from contextlib import asynccontextmanager
 
+from cachetools import TTLCache
+
 # Intentar importar MCP SDK
 try:
+    import anyio
     from mcp import ClientSession, SSEServerParameters
     from mcp.client.sse import sse_client
     MCP_AVAILABLE = True
+    # Errores que indican que la conexión con el gateway se perdió
+    _TRANSPORT_ERRORS = (
+        ConnectionError,
+        OSError,
+        EOFError,
+        anyio.ClosedResourceError,
+        anyio.BrokenResourceError,
+        anyio.EndOfStream
+    )
 except ImportError:
     MCP_AVAILABLE = False
+    _TRANSPORT_ERRORS = (ConnectionError, OSError, EOFError)
     logging.warning("MCP SDK not installed. Run: pip install mcp")
 
+# orjson es opcional: decodifica las respuestas del gateway más rápido
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+# Caché de respuestas en proceso (compartido por todas las instancias)
+# Solo se guardan llamadas casi deterministas (temperature <= 0.3)
+_RESPONSE_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=3600)
+_CACHE_LOCK = asyncio.Lock()
+_CACHE_MAX_TEMPERATURE = 0.3
+# A partir de este tamaño, la clave se calcula en un hilo aparte
+_CACHE_KEY_OFFLOAD_BYTES = 32 * 1024
+
+# Alias de modelos -> nombre canónico del gateway (IDs completos de Bedrock)
+# Se puede extender con la variable de entorno BEDROCK_GATEWAY_MODEL_ALIASES
+# (objeto JSON), p. ej. '{"sonnet": "claude-3-5-sonnet"}'
+_MODEL_ALIASES: Dict[str, str] = {
+    "us.amazon.nova-pro-v1:0": "nova-pro",
+    "us.amazon.nova-lite-v1:0": "nova-lite",
+    "us.amazon.nova-micro-v1:0": "nova-micro",
+    "us.anthropic.claude-3-5-sonnet-20241022-v2:0": "claude-3-5-sonnet",
+    "us.anthropic.claude-3-5-haiku-20241022-v1:0": "claude-3-5-haiku",
+    "anthropic.claude-3-opus-20240229-v1:0": "claude-3-opus",
+    "anthropic.claude-3-sonnet-20240229-v1:0": "claude-3-sonnet",
+    "anthropic.claude-3-haiku-20240307-v1:0": "claude-3-haiku",
+    "us.meta.llama3-3-70b-instruct-v1:0": "llama-3-3-70b",
+    "us.meta.llama3-2-90b-instruct-v1:0": "llama-3-2-90b",
+    "us.meta.llama3-2-11b-instruct-v1:0": "llama-3-2-11b",
+    "meta.llama3-1-70b-instruct-v1:0": "llama-3-1-70b",
+    "meta.llama3-1-8b-instruct-v1:0": "llama-3-1-8b",
+    "mistral.mistral-large-2407-v1:0": "mistral-large-2",
+    "mistral.mistral-small-2402-v1:0": "mistral-small",
+}
+
+
+def _load_env_aliases() -> Dict[str, str]:
+    """Leer alias adicionales de BEDROCK_GATEWAY_MODEL_ALIASES.
+    
+    Un valor mal formado se ignora con un warning, en lugar de impedir
+    que se importe el módulo.
+    """
+    raw = os.environ.get("BEDROCK_GATEWAY_MODEL_ALIASES")
+    if not raw:
+        return {}
+    
+    try:
+        aliases = json.loads(raw)
+    except ValueError as e:
+        logger.warning(f"Ignoring invalid BEDROCK_GATEWAY_MODEL_ALIASES: {str(e)}")
+        return {}
+    
+    if not isinstance(aliases, dict) or not all(
+        isinstance(k, str) and isinstance(v, str) for k, v in aliases.items()
+    ):
+        logger.warning(
+            "Ignoring BEDROCK_GATEWAY_MODEL_ALIASES: expected a JSON object of strings"
+        )
+        return {}
+    
+    return aliases
+
+
+_MODEL_ALIASES.update(_load_env_aliases())
+
+# Tiempo (segundos) durante el que se reutiliza la lista de modelos
+_MODELS_TTL = 300
+
+# Solicitudes en curso, indexadas con la misma clave que el caché
+_INFLIGHT: Dict[str, asyncio.Future] = {}
+_INFLIGHT_LOCK = asyncio.Lock()
+
+
+def _canonical_model(model: str) -> str:
+    """Resolver un alias de modelo a su nombre canónico en el gateway."""
+    return _MODEL_ALIASES.get(model, model)
+
+
+def _cache_key(
+    model: str,
+    messages: list[Dict[str, str]],
+    temperature: float,
+    max_tokens: int
+) -> str:
+    """Construir clave de caché determinista para una solicitud de generación."""
+    payload = json.dumps(
+        {
+            "m": model,
+            "msgs": messages,
+            "t": round(temperature, 1),
+            "mt": max_tokens
+        },
+        sort_keys=True
+    )
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+async def _cache_key_async(
+    model: str,
+    messages: list[Dict[str, str]],
+    temperature: float,
+    max_tokens: int
+) -> str:
+    """Igual que `_cache_key`, pero fuera del event loop para prompts grandes."""
+    size = sum(len(msg.get("content", "")) for msg in messages)
+    if size > _CACHE_KEY_OFFLOAD_BYTES:
+        return await asyncio.to_thread(_cache_key, model, messages, temperature, max_tokens)
+    return _cache_key(model, messages, temperature, max_tokens)
+
+
+def _structured_content(result) -> Any:
+    """Devolver el contenido estructurado de un resultado MCP, si existe.
+    
+    Se devuelve tal cual; los tools cuya salida no es un objeto (p. ej.
+    "list_models", que devuelve una lista) llegan envueltos por FastMCP como
+    {"result": ...} y quien los llama debe desenvolverlos.
+    """
+    return getattr(result, "structuredContent", None)
+
 
 class BedrockGatewayClient:
     """Cliente para comunicación con Bedrock Gateway vía MCP sobre HTTP/SSE.
@@ -42,6 +182,19 @@ class BedrockGatewayClient:
         ```
     """
     
+    __slots__ = (
+        "gateway_url",
+        "api_key",
+        "timeout",
+        "session",
+        "_owner",
+        "_closing",
+        "_server_params",
+        "_models",
+        "_models_ts",
+        "_init_done",
+    )
+    
     def __init__(
         self,
         gateway_url: str = "http://localhost:8000",
@@ -64,64 +217,107 @@ class BedrockGatewayClient:
         self.api_key = api_key
         self.timeout = timeout
         
+        # Parámetros del servidor SSE (se reutilizan en cada reconexión)
+        headers = {"Authorization": f"Bearer {api_key}"} if api_key else None
+        self._server_params = SSEServerParameters(
+            url=f"{self.gateway_url}/mcp/sse",
+            headers=headers,
+            timeout=self.timeout
+        )
+        
         self.session: Optional[ClientSession] = None
-        self._read = None
-        self._write = None
-        self._client_context = None
+        # Tarea dueña de la conexión: abre y cierra el transporte SSE
+        self._owner: Optional[asyncio.Task] = None
+        self._closing: Optional[asyncio.Event] = None
+        self._models: Optional[list[Dict[str, Any]]] = None
+        self._models_ts = 0.0
+        self._init_done = False
         
         logger.info(
             f"BedrockGatewayClient initialized - "
             f"Gateway URL: {self.gateway_url}"
         )
     
-    async def connect(self):
-        """Conectar al Bedrock Gateway vía HTTP/SSE."""
+    async def connect(self, warm: bool = False):
+        """Conectar al Bedrock Gateway vía HTTP/SSE.
+        
+        Si ya hay una sesión inicializada, no hace nada.
+        
+        Args:
+            warm: Si es True, también descarga la lista de modelos (una RPC extra)
+        """
+        if self.session is not None and self._init_done:
+            logger.debug("Already connected to Bedrock Gateway")
+            return
+        
         try:
             logger.info(f"Connecting to Bedrock Gateway at {self.gateway_url}...")
             
-            # Construir headers con autenticación si se proporciona
-            headers = {}
-            if self.api_key:
-                headers["Authorization"] = f"Bearer {self.api_key}"
-            
-            # Crear parámetros del servidor SSE
-            server_params = SSEServerParameters(
-                url=f"{self.gateway_url}/mcp/sse",
-                headers=headers if headers else None,
-                timeout=self.timeout
-            )
-            
-            # Conectar al gateway vía SSE
-            self._client_context = sse_client(server_params)
-            self._read, self._write = await self._client_context.__aenter__()
-            
-            # Crear sesión MCP
-            self.session = ClientSession(self._read, self._write)
-            await self.session.__aenter__()
-            
-            # Inicializar sesión
-            await self.session.initialize()
+            # La conexión se abre y se cierra dentro de una sola tarea: los
+            # task groups de anyio de sse_client no se pueden cerrar desde
+            # otra tarea (p. ej. si connect() corrió dentro de asyncio.gather)
+            ready = asyncio.get_running_loop().create_future()
+            self._closing = asyncio.Event()
+            self._owner = asyncio.create_task(self._run_connection(ready))
+            try:
+                await ready
+            except asyncio.CancelledError:
+                self._owner.cancel()
+                raise
             
             logger.info("Connected to Bedrock Gateway successfully")
             
-            # Obtener lista de modelos disponibles
-            models = await self.list_models()
-            logger.info(f"Available models: {len(models)}")
+            if warm:
+                await self.ensure_models()
+            else:
+                logger.debug("Skipping model discovery")
             
         except Exception as e:
             logger.error(f"Failed to connect to gateway: {str(e)}")
             raise ConnectionError(f"Cannot connect to Bedrock Gateway: {str(e)}")
     
+    async def _run_connection(self, ready: asyncio.Future):
+        """Mantener la conexión SSE y la sesión MCP hasta que se pida cerrarla.
+        
+        Args:
+            ready: Se resuelve cuando la sesión está inicializada, o con la
+                   excepción si la conexión falla
+        """
+        try:
+            async with sse_client(self._server_params) as (read, write):
+                async with ClientSession(read, write) as session:
+                    await session.initialize()
+                    self.session = session
+                    self._init_done = True
+                    ready.set_result(None)
+                    
+                    await self._closing.wait()
+        
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                logger.warning(f"Connection to Bedrock Gateway lost: {str(e)}")
+        
+        finally:
+            self.session = None
+            self._init_done = False
+            if not ready.done():
+                ready.cancel()
+    
     async def disconnect(self):
         """Desconectar del gateway."""
         try:
             logger.info("Disconnecting from Bedrock Gateway...")
             
-            if self.session:
-                await self.session.__aexit__(None, None, None)
+            owner, self._owner = self._owner, None
+            if owner is not None and not owner.done():
+                # La tarea dueña sale de los context managers de la conexión
+                self._closing.set()
+                await owner
             
-            if self._client_context:
-                await self._client_context.__aexit__(None, None, None)
+            self.session = None
+            self._init_done = False
             
             logger.info("Disconnected from Bedrock Gateway")
             
@@ -133,15 +329,25 @@ class BedrockGatewayClient:
         model: str,
         messages: list[Dict[str, str]],
         temperature: float = 0.7,
-        max_tokens: int = 2000
+        max_tokens: int = 2000,
+        use_cache: bool = True,
+        cache_prefix: bool = True
     ) -> Dict[str, Any]:
         """Generar completion usando el Bedrock Gateway.
         
+        Las respuestas con temperature <= 0.3 se guardan en un caché local
+        (TTL de 1 hora), de modo que las solicitudes repetidas no llegan al gateway.
+        Un acierto se devuelve con cached=True, latency_ms=0 y costo 0.
+        
         Args:
-            model: Nombre del modelo (ej: "nova-pro", "claude-3-5-sonnet")
+            model: Nombre del modelo (ej: "nova-pro", "claude-3-5-sonnet") o
+                   su ID completo de Bedrock
             messages: Lista de mensajes con formato [{"role": "user", "content": "..."}]
             temperature: Temperatura de muestreo (0.0-2.0)
             max_tokens: Máximo de tokens a generar
+            use_cache: Consultar/guardar en el caché local (default: True)
+            cache_prefix: Pedir al gateway que marque el prefijo de la conversación
+                          para el prompt caching de Bedrock (default: True)
             
         Returns:
             Dict con la respuesta:
@@ -151,7 +357,9 @@ class BedrockGatewayClient:
                 "usage": {
                     "input_tokens": int,
                     "output_tokens": int,
-                    "total_tokens": int
+                    "total_tokens": int,
+                    "cache_read_input_tokens": int,   # Tokens leídos del prompt cache
+                    "cache_write_input_tokens": int
                 },
                 "cached": bool,           # Si vino del caché
                 "latency_ms": float,      # Latencia en ms
@@ -165,60 +373,243 @@ class BedrockGatewayClient:
         if not self.session:
             raise ConnectionError("Not connected to gateway. Call connect() first.")
         
+        model = _canonical_model(model)
+        # Por encima del umbral cada llamada es una muestra distinta: ni caché
+        # ni unión a solicitudes en curso
+        cacheable = use_cache and temperature <= _CACHE_MAX_TEMPERATURE
+        key = await _cache_key_async(model, messages, temperature, max_tokens) if cacheable else None
+        
+        if key is None:
+            return await self._call_generate(model, messages, temperature, max_tokens, cache_prefix)
+        
+        async with _CACHE_LOCK:
+            hit = _RESPONSE_CACHE.get(key)
+        if hit is not None:
+            logger.info(f"Local cache hit for model={model}")
+            return {**copy.deepcopy(hit), "cached": True, "latency_ms": 0.0, "estimated_cost_usd": 0.0}
+        
+        # Single-flight: las solicitudes idénticas concurrentes esperan a la primera
+        async with _INFLIGHT_LOCK:
+            future = _INFLIGHT.get(key)
+            owner = future is None
+            if owner:
+                future = asyncio.get_running_loop().create_future()
+                # Evitar el warning "exception was never retrieved" si nadie espera
+                future.add_done_callback(lambda f: f.cancelled() or f.exception())
+                _INFLIGHT[key] = future
+        
+        if not owner:
+            logger.info(f"Joining in-flight request for model={model}")
+            try:
+                return copy.deepcopy(await asyncio.shield(future))
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # Se canceló quien hacía la llamada, no este llamador: repetirla
+                logger.info(f"In-flight request cancelled, retrying for model={model}")
+                return await self._call_generate(model, messages, temperature, max_tokens, cache_prefix)
+        
+        try:
+            response_data = await self._call_generate(model, messages, temperature, max_tokens, cache_prefix)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        else:
+            # Copia profunda: el llamador puede modificar la respuesta (incluido
+            # "usage"); los aciertos y los que esperan copian a su vez
+            stored = copy.deepcopy(response_data)
+            future.set_result(stored)
+            async with _CACHE_LOCK:
+                _RESPONSE_CACHE[key] = stored
+            return response_data
+        finally:
+            async with _INFLIGHT_LOCK:
+                _INFLIGHT.pop(key, None)
+    
+    async def _call_generate(
+        self,
+        model: str,
+        messages: list[Dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+        cache_prefix: bool
+    ) -> Dict[str, Any]:
+        """Llamar al tool "generate" del gateway y decodificar la respuesta."""
         try:
             logger.info(f"Generating with model={model}, messages={len(messages)}")
             
-            # Llamar al tool "generate" del gateway
-            result = await self.session.call_tool(
-                "generate",
+            # Llamar al tool "generate" del gateway (acotado por self.timeout)
+            try:
+                result = await asyncio.wait_for(
+                    self.session.call_tool(
+                        "generate",
+                        arguments={
+                            "model": model,
+                            "messages": messages,
+                            "temperature": temperature,
+                            "max_tokens": max_tokens,
+                            "cache_prefix": cache_prefix
+                        }
+                    ),
+                    timeout=self.timeout
+                )
+            except asyncio.TimeoutError:
+                raise TimeoutError(
+                    f"Gateway did not respond within {self.timeout}s (model={model})"
+                )
+            
+            return self._parse_generate_result(result)
+            
+        except Exception as e:
+            logger.error(f"Error generating completion: {str(e)}")
+            raise
+    
+    async def generate_stream(
+        self,
+        model: str,
+        messages: list[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        cache_prefix: bool = True
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Generar completion recibiendo el texto a medida que se produce.
+        
+        Usa el tool "generate_stream" del gateway, que envía los fragmentos de
+        texto como notificaciones de progreso MCP (agrupados cada ~100 ms).
+        Las respuestas en streaming no pasan por el caché local.
+        
+        Args:
+            model: Nombre del modelo (ej: "nova-pro", "claude-3-5-sonnet")
+            messages: Lista de mensajes con formato [{"role": "user", "content": "..."}]
+            temperature: Temperatura de muestreo (0.0-2.0)
+            max_tokens: Máximo de tokens a generar
+            cache_prefix: Pedir al gateway que marque el prefijo de la conversación
+                          para el prompt caching de Bedrock (default: True)
+            
+        Yields:
+            {"delta": str, "done": False} por cada fragmento y, al final,
+            {"delta": "", "done": True, "response": {...}} con la misma
+            respuesta que devuelve `generate()`
+            
+        Ejemplo:
+            ```python
+            async for chunk in client.generate_stream(
+                model="nova-lite",
+                messages=[{"role": "user", "content": "Hola"}]
+            ):
+                print(chunk["delta"], end="", flush=True)
+            ```
+        """
+        if not self.session:
+            raise ConnectionError("Not connected to gateway. Call connect() first.")
+        
+        model = _canonical_model(model)
+        logger.info(f"Streaming with model={model}, messages={len(messages)}")
+        
+        chunks: asyncio.Queue = asyncio.Queue()
+        
+        async def _on_progress(progress, total, message):
+            if message:
+                chunks.put_nowait(message)
+        
+        call = asyncio.create_task(
+            self.session.call_tool(
+                "generate_stream",
                 arguments={
                     "model": model,
                     "messages": messages,
                     "temperature": temperature,
-                    "max_tokens": max_tokens
-                }
+                    "max_tokens": max_tokens,
+                    "cache_prefix": cache_prefix
+                },
+                progress_callback=_on_progress
             )
+        )
+        
+        next_chunk = None
+        try:
+            while True:
+                next_chunk = asyncio.ensure_future(chunks.get())
+                done, _ = await asyncio.wait(
+                    {next_chunk, call},
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                if next_chunk in done:
+                    yield {"delta": next_chunk.result(), "done": False}
+                else:
+                    next_chunk.cancel()
+                if call in done:
+                    break
+            
+            # Fragmentos que llegaron junto con el resultado final
+            while not chunks.empty():
+                yield {"delta": chunks.get_nowait(), "done": False}
+            
+            response_data = self._parse_generate_result(call.result())
+            yield {"delta": "", "done": True, "response": response_data}
             
+        except Exception as e:
+            logger.error(f"Error streaming completion: {str(e)}")
+            raise
+        
+        finally:
+            if next_chunk is not None and not next_chunk.done():
+                next_chunk.cancel()
+            if not call.done():
+                call.cancel()
+    
+    def _parse_generate_result(self, result) -> Dict[str, Any]:
+        """Decodificar el resultado MCP de los tools "generate"/"generate_stream"."""
+        # Preferir el contenido estructurado: evita volver a parsear el JSON
+        response_data = _structured_content(result)
+        
+        if response_data is None:
             # Extraer contenido de la respuesta MCP
-            if result.content and len(result.content) > 0:
-                import json
-                
-                # El contenido puede venir como JSON string o como objeto
-                content_text = result.content[0].text
-                
-                # Debug: imprimir el contenido completo
-                print(f"DEBUG - Content type: {type(content_text)}", file=__import__('sys').stderr)
-                print(f"DEBUG - Content: {repr(content_text)}", file=__import__('sys').stderr)
-                print(f"DEBUG - Content length: {len(content_text) if isinstance(content_text, str) else 'N/A'}", file=__import__('sys').stderr)
-                
-                # Si ya es un dict, devolverlo directamente
-                if isinstance(content_text, dict):
-                    response_data = content_text
-                else:
-                    # Intentar parsear si es string JSON
-                    # Limpiar cualquier espacio o caracteres extraños al inicio
-                    content_text = content_text.strip()
-                    if not content_text:
-                        raise Exception("Empty response content from gateway")
-                    response_data = json.loads(content_text)
-                
-                logger.info(
-                    f"Generation complete - "
-                    f"tokens={response_data['usage']['total_tokens']}, "
-                    f"cost=${response_data.get('estimated_cost_usd', response_data.get('cost_usd', 0)):.6f}"
+            if not result.content:
+                raise Exception("Empty response from gateway")
+            
+            # El contenido puede venir como JSON string o como objeto
+            content_text = result.content[0].text
+            
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Gateway response content type=%s len=%s",
+                    type(content_text).__name__,
+                    len(content_text) if isinstance(content_text, str) else "N/A"
                 )
-                
-                return response_data
+            
+            # Si ya es un dict, devolverlo directamente
+            if isinstance(content_text, dict):
+                response_data = content_text
             else:
-                raise Exception("Empty response from gateway")
-                
-        except Exception as e:
-            logger.error(f"Error generating completion: {str(e)}")
-            raise
+                # Intentar parsear si es string JSON (el parser ya ignora
+                # los espacios alrededor, no hace falta copiar con strip())
+                if not content_text or content_text.isspace():
+                    raise Exception("Empty response content from gateway")
+                response_data = _loads(content_text)
+        
+        usage = response_data["usage"]
+        cost = response_data.get("estimated_cost_usd") or response_data.get("cost_usd", 0.0)
+        logger.info(
+            f"Generation complete - "
+            f"tokens={usage['total_tokens']}, "
+            f"cost=${cost:.6f}"
+        )
+        
+        return response_data
     
-    async def list_models(self) -> list[Dict[str, Any]]:
+    async def list_models(self, force_refresh: bool = False) -> list[Dict[str, Any]]:
         """Listar modelos disponibles en el gateway.
         
+        El catálogo solo cambia al reiniciar el gateway, así que el resultado
+        se guarda durante 5 minutos; `force_refresh=True` vuelve a consultarlo.
+        
+        Args:
+            force_refresh: Ignorar la lista guardada (default: False)
+        
         Returns:
             Lista de modelos con metadata:
             [
@@ -232,23 +623,51 @@ class BedrockGatewayClient:
                 }
             ]
         """
+        if (
+            not force_refresh
+            and self._models is not None
+            and time.monotonic() - self._models_ts < _MODELS_TTL
+        ):
+            return self._models
+        
         if not self.session:
             raise ConnectionError("Not connected to gateway. Call connect() first.")
         
         try:
             result = await self.session.call_tool("list_models", arguments={})
             
-            if result.content and len(result.content) > 0:
-                import json
-                models = json.loads(result.content[0].text)
-                return models
+            # "list_models" devuelve una lista, que FastMCP envuelve en {"result": [...]}
+            models = _structured_content(result)
+            if models is not None:
+                models = models["result"]
+            elif result.content and len(result.content) > 0:
+                models = _loads(result.content[0].text)
             else:
-                return []
+                models = []
+            
+            self._models = models
+            self._models_ts = time.monotonic()
+            return models
                 
         except Exception as e:
             logger.error(f"Error listing models: {str(e)}")
             raise
     
+    async def ensure_models(self) -> list[Dict[str, Any]]:
+        """Obtener la lista de modelos, consultando al gateway solo si hace falta.
+        
+        Returns:
+            Lista de modelos (ver `list_models`)
+        """
+        models = await self.list_models()
+        logger.info(f"Available models: {len(models)}")
+        return models
+    
+    @property
+    def models(self) -> Optional[list[Dict[str, Any]]]:
+        """Última lista de modelos obtenida del gateway (None si aún no se consultó)."""
+        return self._models
+    
     async def get_stats(self) -> Dict[str, Any]:
         """Obtener estadísticas del gateway (métricas y caché).
         
@@ -261,9 +680,12 @@ class BedrockGatewayClient:
         try:
             result = await self.session.call_tool("get_stats", arguments={})
             
+            stats = _structured_content(result)
+            if stats is not None:
+                return stats
+            
             if result.content and len(result.content) > 0:
-                import json
-                stats = json.loads(result.content[0].text)
+                stats = _loads(result.content[0].text)
                 return stats
             else:
                 return {}
@@ -282,22 +704,129 @@ class BedrockGatewayClient:
         await self.disconnect()
 
 
+# Clientes compartidos: una sesión MCP persistente por gateway y API key.
+# Una sesión queda ligada al event loop que la abrió, así que cada loop
+# (p. ej. cada asyncio.run) tiene su propio registro y su propio lock.
+_SHARED_CLIENTS: Dict[
+    asyncio.AbstractEventLoop,
+    Dict[Tuple[str, Optional[str]], BedrockGatewayClient]
+] = {}
+_SHARED_CLIENTS_LOCKS: Dict[asyncio.AbstractEventLoop, asyncio.Lock] = {}
+
+
+def _shared_registry() -> Tuple[asyncio.Lock, Dict[Tuple[str, Optional[str]], BedrockGatewayClient]]:
+    """Devolver el lock y el registro de clientes del event loop en ejecución."""
+    loop = asyncio.get_running_loop()
+    
+    # Los clientes de loops ya cerrados no se pueden usar ni cerrar: olvidarlos
+    for stale in [other for other in _SHARED_CLIENTS if other.is_closed()]:
+        del _SHARED_CLIENTS[stale]
+        _SHARED_CLIENTS_LOCKS.pop(stale, None)
+    
+    if loop not in _SHARED_CLIENTS:
+        _SHARED_CLIENTS[loop] = {}
+        _SHARED_CLIENTS_LOCKS[loop] = asyncio.Lock()
+    return _SHARED_CLIENTS_LOCKS[loop], _SHARED_CLIENTS[loop]
+
+
+async def get_shared_client(
+    gateway_url: str = "http://localhost:8000",
+    api_key: Optional[str] = None
+) -> BedrockGatewayClient:
+    """Obtener un cliente conectado y reutilizable para el gateway y la API key indicados.
+    
+    La conexión SSE y el handshake MCP se hacen una sola vez por event loop;
+    las llamadas siguientes reutilizan la misma sesión. Si la sesión se cerró
+    o se descartó por un error de transporte, se abre una nueva.
+    
+    Las sesiones quedan abiertas hasta que se llama a `close_shared_clients()`,
+    que debe esperarse (await) antes de que termine el event loop.
+    
+    Args:
+        gateway_url: URL base del gateway (default: "http://localhost:8000")
+        api_key: API key para autenticación (opcional)
+        
+    Returns:
+        Cliente conectado
+    """
+    key = (gateway_url, api_key)
+    lock, clients = _shared_registry()
+    async with lock:
+        client = clients.get(key)
+        if client is None or client.session is None:
+            client = BedrockGatewayClient(gateway_url=gateway_url, api_key=api_key)
+            await client.connect()
+            clients[key] = client
+        return client
+
+
+async def _discard_shared_client(client: BedrockGatewayClient) -> None:
+    """Sacar del registro un cliente cuya conexión se perdió y cerrarlo."""
+    lock, clients = _shared_registry()
+    async with lock:
+        keys = [key for key, other in clients.items() if other is client]
+        for key in keys:
+            del clients[key]
+    
+    # Solo quien lo sacó del registro lo cierra (varias llamadas pueden fallar a la vez)
+    if keys:
+        await client.disconnect()
+
+
+@asynccontextmanager
+async def _shared_call(client: BedrockGatewayClient):
+    """Descartar el cliente compartido si la llamada falla por la conexión.
+    
+    Así la siguiente llamada abre una sesión nueva en lugar de reutilizar
+    una que ya no funciona. Un timeout no descarta la sesión.
+    """
+    try:
+        yield
+    except _TRANSPORT_ERRORS as e:
+        if not isinstance(e, TimeoutError):
+            logger.warning(f"Gateway connection lost, discarding shared client: {str(e)}")
+            await _discard_shared_client(client)
+        raise
+
+
+async def close_shared_clients() -> None:
+    """Cerrar todas las sesiones abiertas por `get_shared_client` en este event loop.
+    
+    Debe esperarse (await) antes de cerrar el event loop (p. ej. al final de
+    `main()`); las sesiones SSE no se pueden cerrar desde `atexit` porque el
+    loop ya no existe.
+    """
+    lock, clients = _shared_registry()
+    async with lock:
+        to_close = list(clients.values())
+        clients.clear()
+    
+    for client in to_close:
+        await client.disconnect()
+
+
 # Función helper para uso rápido
 async def generate_with_bedrock(
     model: str,
     messages: list[Dict[str, str]],
     temperature: float = 0.7,
     max_tokens: int = 2000,
-    gateway_env: Dict[str, str] = None
+    gateway_url: str = "http://localhost:8000",
+    api_key: Optional[str] = None
 ) -> Dict[str, Any]:
     """Helper para generar completion sin manejar conexión manualmente.
     
+    Usa el cliente compartido de `get_shared_client`, así que la sesión MCP
+    se abre solo en la primera llamada de cada event loop. Al terminar, esperar
+    `close_shared_clients()` para cerrarla.
+    
     Args:
         model: Nombre del modelo Bedrock
         messages: Mensajes de la conversación
         temperature: Temperatura
         max_tokens: Tokens máximos
-        gateway_env: Variables de entorno AWS (opcional)
+        gateway_url: URL base del gateway (default: "http://localhost:8000")
+        api_key: API key para autenticación (opcional)
         
     Returns:
         Respuesta del modelo
@@ -307,15 +836,13 @@ async def generate_with_bedrock(
         response = await generate_with_bedrock(
             model="nova-pro",
             messages=[{"role": "user", "content": "Hola"}],
-            gateway_env={
-                "AWS_ACCESS_KEY_ID": "...",
-                "AWS_SECRET_ACCESS_KEY": "...",
-            }
+            gateway_url="https://tu-gateway.com"
         )
         print(response["content"])
         ```
     """
-    async with BedrockGatewayClient(gateway_env=gateway_env) as client:
+    client = await get_shared_client(gateway_url=gateway_url, api_key=api_key)
+    async with _shared_call(client):
         return await client.generate(
             model=model,
             messages=messages,
@@ -324,7 +851,58 @@ async def generate_with_bedrock(
         )
 
 
+async def generate_batch_with_bedrock(
+    model: str,
+    prompts: list[str],
+    temperature: float = 0.7,
+    max_tokens: int = 2000,
+    concurrency: int = 10,
+    gateway_url: str = "http://localhost:8000",
+    api_key: Optional[str] = None
+) -> list[str]:
+    """Generar varias completions en paralelo sobre una sola sesión MCP.
+    
+    Args:
+        model: Nombre del modelo Bedrock
+        prompts: Lista de prompts (cada uno se envía como un mensaje de usuario)
+        temperature: Temperatura
+        max_tokens: Tokens máximos
+        concurrency: Máximo de solicitudes simultáneas (default: 10)
+        gateway_url: URL base del gateway (default: "http://localhost:8000")
+        api_key: API key para autenticación (opcional)
+        
+    Returns:
+        Lista con el texto generado para cada prompt, en el mismo orden
+        
+    Ejemplo:
+        ```python
+        answers = await generate_batch_with_bedrock(
+            model="nova-lite",
+            prompts=["¿Qué es MCP?", "¿Qué es Bedrock?"],
+            concurrency=5
+        )
+        ```
+    """
+    client = await get_shared_client(gateway_url=gateway_url, api_key=api_key)
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def _one(prompt: str) -> str:
+        async with semaphore, _shared_call(client):
+            response = await client.generate(
+                model=model,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=temperature,
+                max_tokens=max_tokens
+            )
+            return response["content"]
+    
+    return await asyncio.gather(*(_one(prompt) for prompt in prompts))
+
+
 __all__ = [
     "BedrockGatewayClient",
-    "generate_with_bedrock"
+    "get_shared_client",
+    "close_shared_clients",
+    "generate_with_bedrock",
+    "generate_batch_with_bedrock"
 ]
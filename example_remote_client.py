@@ -6,6 +6,7 @@ desplegado en producción usando HTTP/SSE.
 
 import asyncio
 import logging
+import sys
 from bedrock_client import BedrockGatewayClient
 
 # Configurar logging
@@ -27,50 +28,89 @@ async def main():
         timeout=300
     ) as client:
         
-        print("\n" + "="*60)
-        print("🚀 CONECTADO AL BEDROCK GATEWAY (HTTP/SSE)")
-        print("="*60 + "\n")
+        sys.stdout.write("\n".join([
+            "",
+            "=" * 60,
+            "🚀 CONECTADO AL BEDROCK GATEWAY (HTTP/SSE)",
+            "=" * 60,
+            "",
+        ]) + "\n")
         
-        # 1. Listar modelos disponibles
-        print("📋 Modelos disponibles:")
-        models = await client.list_models()
-        for model in models[:5]:  # Mostrar primeros 5
-            print(f"  - {model['name']}: {model['description']}")
-        print(f"  ... y {len(models) - 5} modelos más\n")
-        
-        # 2. Generar completion con Nova Lite (el más económico)
-        print("💬 Generando respuesta con Nova Lite...")
-        response = await client.generate(
-            model="nova-lite",
-            messages=[
-                {"role": "user", "content": "¿Qué es el protocolo MCP?"}
-            ],
-            temperature=0.7,
-            max_tokens=500
+        # 1 y 2. Listar modelos y generar con Nova Lite (el más económico)
+        # Son independientes, así que se lanzan en paralelo sobre la misma sesión
+        sys.stdout.write("💬 Generando respuesta con Nova Lite...\n")
+        models, response = await asyncio.gather(
+            client.list_models(),
+            client.generate(
+                model="nova-lite",
+                messages=[
+                    {"role": "user", "content": "¿Qué es el protocolo MCP?"}
+                ],
+                temperature=0.7,
+                max_tokens=500
+            )
         )
         
-        print(f"\n📝 Respuesta:")
-        print(f"{response['content']}\n")
+        # Construir todo el bloque de salida y escribirlo de una vez
+        usage = response.get("usage") or {}
+        cost = response.get("estimated_cost_usd") or response.get("cost_usd", 0.0)
+        lines = ["", "📋 Modelos disponibles:"]
+        lines.extend(
+            f"  - {model['name']}: {model['description']}"
+            for model in models[:5]  # Mostrar primeros 5
+        )
+        lines += [
+            f"  ... y {len(models) - 5} modelos más",
+            "",
+            "",
+            "📝 Respuesta:",
+            response["content"],
+            "",
+            "📊 Métricas:",
+            f"  - Tokens: {usage.get('total_tokens', 0)}",
+            f"  - Costo: ${cost:.6f}",
+            f"  - Latencia: {response['latency_ms']}ms",
+            f"  - Cache: {'✅ HIT' if response.get('cached', False) else '❌ MISS'}",
+            "",
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
         
-        print(f"📊 Métricas:")
-        print(f"  - Tokens: {response['usage']['total_tokens']}")
-        print(f"  - Costo: ${response['cost_usd']:.6f}")
-        print(f"  - Latencia: {response['latency_ms']}ms")
-        print(f"  - Cache: {'✅ HIT' if response.get('cached', False) else '❌ MISS'}\n")
+        # 3. Generar en streaming: el texto aparece mientras el modelo genera
+        sys.stdout.write("🌊 Respuesta en streaming (Nova Micro):\n")
+        async for chunk in client.generate_stream(
+            model="nova-micro",
+            messages=[
+                {"role": "user", "content": "Resume en dos frases qué es Amazon Bedrock."}
+            ],
+            max_tokens=200
+        ):
+            sys.stdout.write(chunk["delta"])
+            sys.stdout.flush()
+        sys.stdout.write("\n\n")
         
-        # 3. Obtener estadísticas del gateway
-        print("📈 Estadísticas del gateway:")
+        # 4. Obtener estadísticas del gateway
         stats = await client.get_stats()
         metrics = stats.get("metrics", {})
-        print(f"  - Requests totales: {metrics.get('total_requests', 0)}")
-        print(f"  - Tokens totales: {metrics.get('total_tokens', 0)}")
-        print(f"  - Costo total: ${metrics.get('total_cost_usd', 0):.6f}")
-        print(f"  - Cache hit rate: {metrics.get('cache_hit_rate_percent', 0):.1f}%\n")
-        
-        print("="*60)
-        print("✅ EJEMPLO COMPLETADO")
-        print("="*60 + "\n")
+        sys.stdout.write("\n".join([
+            "📈 Estadísticas del gateway:",
+            f"  - Requests totales: {metrics.get('total_requests', 0)}",
+            f"  - Tokens totales: {metrics.get('total_tokens', 0)}",
+            f"  - Costo total: ${metrics.get('total_cost_usd', 0):.6f}",
+            f"  - Cache hit rate: {metrics.get('cache_hit_rate_percent', 0):.1f}%",
+            "",
+            "=" * 60,
+            "✅ EJEMPLO COMPLETADO",
+            "=" * 60,
+            "",
+        ]) + "\n")
 
 
 if __name__ == "__main__":
+    # uvloop es opcional: si no está instalado (o en Windows) se usa el loop por defecto
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     asyncio.run(main())
@@ -1,5 +1,5 @@
 """Bedrock module initialization."""
 
-from .bedrock_client import BedrockClient, bedrock_client
+from .bedrock_client import BedrockClient, get_bedrock_client
 
-__all__ = ["BedrockClient", "bedrock_client"]
+__all__ = ["BedrockClient", "get_bedrock_client"]
@@ -1,8 +1,12 @@
 """AWS Bedrock Client - Universal client for all Bedrock foundation models."""
 
+import asyncio
 import logging
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import List, Dict, Any, AsyncIterator, Optional
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from ..config import settings
@@ -19,15 +23,44 @@ class BedrockClient:
         """Initialize Bedrock client (single client for all models)."""
         self.region = settings.AWS_REGION
         
+        # Connection pool sized for concurrent calls; keep-alive lets
+        # subsequent requests reuse warm TLS connections
+        config = Config(
+            max_pool_connections=settings.BEDROCK_POOL_SIZE,
+            tcp_keepalive=True,
+            retries={"max_attempts": 3, "mode": "adaptive"}
+        )
+        
+        # Dedicated worker pool for blocking boto3 calls, one thread per pooled connection
+        self._executor = ThreadPoolExecutor(
+            max_workers=settings.BEDROCK_POOL_SIZE,
+            thread_name_prefix="bedrock"
+        )
+        
         # Initialize boto3 client (reusable for all models)
         self.client = boto3.client(
             service_name="bedrock-runtime",
             region_name=self.region,
             aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY
+            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+            config=config
+        )
+        
+        logger.info(
+            f"Bedrock client initialized: region={self.region}, "
+            f"pool_size={settings.BEDROCK_POOL_SIZE}"
         )
+    
+    async def _run(self, func):
+        """Run a blocking boto3 call on the Bedrock worker pool.
         
-        logger.info(f"Bedrock client initialized: region={self.region}")
+        Args:
+            func: Zero-argument callable (usually a functools.partial)
+            
+        Returns:
+            The callable's return value
+        """
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func)
     
     def _convert_messages_to_bedrock_format(
         self, 
@@ -43,32 +76,121 @@ class BedrockClient:
         Returns:
             Tuple of (system_prompt, conversation_messages)
         """
-        system_prompt = None
-        conversation = []
-        
-        for msg in messages:
-            role = msg["role"]
-            content = msg["content"]
-            
-            if role == "system":
-                if supports_system:
-                    system_prompt = content
-                else:
-                    # For models that don't support system, prepend to first user message
-                    if not conversation:
-                        conversation.append({
-                            "role": "user",
-                            "content": [{"text": f"System: {content}"}]
-                        })
-                    else:
-                        # Prepend to existing first message
-                        conversation[0]["content"][0]["text"] = f"System: {content}\n\n{conversation[0]['content'][0]['text']}"
-            elif role == "user":
-                conversation.append({"role": "user", "content": [{"text": content}]})
-            elif role == "assistant":
-                conversation.append({"role": "assistant", "content": [{"text": content}]})
-        
-        return (system_prompt, conversation)
+        # Fast path for the most common request shape: a single user prompt
+        if len(messages) == 1 and messages[0]["role"] == "user":
+            return (None, [{"role": "user", "content": [{"text": messages[0]["content"]}]}])
+        
+        conversation = [
+            {"role": msg["role"], "content": [{"text": msg["content"]}]}
+            for msg in messages
+            if msg["role"] != "system"
+        ]
+        system_texts = [msg["content"] for msg in messages if msg["role"] == "system"]
+        
+        if not system_texts:
+            return (None, conversation)
+        
+        system_text = "\n".join(system_texts)
+        
+        if supports_system:
+            return (system_text, conversation)
+        
+        # For models that don't support system, prepend to the first message
+        if conversation:
+            first = conversation[0]["content"][0]
+            first["text"] = f"System: {system_text}\n\n{first['text']}"
+        else:
+            conversation.append({
+                "role": "user",
+                "content": [{"text": f"System: {system_text}"}]
+            })
+        
+        return (None, conversation)
+    
+    def _parse_usage(self, usage: Dict[str, int]) -> Dict[str, int]:
+        """Convert Bedrock token usage to the gateway usage format.
+        
+        Args:
+            usage: Bedrock `usage` block (camelCase keys)
+            
+        Returns:
+            Usage dictionary with input, output, total and prompt-cache tokens
+        """
+        input_tokens = usage.get("inputTokens", 0)
+        output_tokens = usage.get("outputTokens", 0)
+        
+        return {
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "total_tokens": usage.get("totalTokens", input_tokens + output_tokens),
+            "cache_read_input_tokens": usage.get("cacheReadInputTokens", 0),
+            "cache_write_input_tokens": usage.get("cacheWriteInputTokens", 0)
+        }
+    
+    def _build_converse_params(
+        self,
+        model_info: BedrockModel,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+        cache_prefix: bool = False
+    ) -> Dict[str, Any]:
+        """Build the request parameters shared by converse and converse_stream.
+        
+        When `cache_prefix` is set and the model supports prompt caching, a
+        `cachePoint` block is added after the system prompt and after the
+        second-to-last message, so everything but the latest turn can be read
+        from Bedrock's prompt cache on the next call. A checkpoint is only
+        added when the prefix it closes reaches the model's minimum cacheable
+        size (estimated at ~4 characters per token); the system prompt is
+        checked on its own.
+        
+        Args:
+            model_info: Resolved model metadata
+            messages: Standard message format
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            cache_prefix: Whether to add prompt cache checkpoints
+            
+        Returns:
+            Keyword arguments for the Bedrock Converse API
+        """
+        # Convert to Bedrock format
+        system_prompt, conversation = self._convert_messages_to_bedrock_format(
+            messages, 
+            supports_system=model_info.supports_system
+        )
+        
+        # Prepare converse parameters
+        converse_params = {
+            "modelId": model_info.model_id,
+            "messages": conversation,
+            "inferenceConfig": {
+                "temperature": temperature,
+                "maxTokens": min(max_tokens, model_info.max_tokens)  # Respect model limits
+            }
+        }
+        
+        # Add system prompt if supported and present
+        if system_prompt and model_info.supports_system:
+            converse_params["system"] = [{"text": system_prompt}]
+        
+        if cache_prefix and model_info.supports_prompt_cache:
+            min_chars = model_info.prompt_cache_min_tokens * 4
+            system_chars = len(system_prompt or "") if "system" in converse_params else 0
+            
+            # Each checkpoint must cover the model minimum on its own
+            if system_chars >= min_chars:
+                converse_params["system"].append({"cachePoint": {"type": "default"}})
+            
+            if len(conversation) > 1:
+                prefix_chars = system_chars + sum(
+                    len(msg["content"][0]["text"]) for msg in conversation[:-1]
+                )
+                if prefix_chars >= min_chars:
+                    conversation[-2]["content"].append({"cachePoint": {"type": "default"}})
+        
+        return converse_params
     
     async def generate(
         self,
@@ -76,6 +198,8 @@ class BedrockClient:
         messages: List[Dict[str, str]],
         temperature: float = 0.7,
         max_tokens: int = 2000,
+        cache_prefix: bool = False,
+        model_info: Optional[BedrockModel] = None,
         **kwargs
     ) -> Dict[str, Any]:
         """Generate response using any Bedrock model.
@@ -85,6 +209,9 @@ class BedrockClient:
             messages: List of message dictionaries
             temperature: Sampling temperature
             max_tokens: Maximum tokens to generate
+            cache_prefix: Add Bedrock prompt cache checkpoints (supported models only)
+            model_info: Already-resolved, already-validated model metadata
+                (messages are validated and the model looked up if omitted)
             **kwargs: Additional parameters
             
         Returns:
@@ -94,65 +221,44 @@ class BedrockClient:
             ValueError: If model not found
             Exception: If API call fails
         """
-        validate_messages(messages)
-        
-        # Get model metadata
-        model_info = get_model(model_name)
+        # Callers that pass model_info (the router) have already validated
+        if model_info is None:
+            validate_messages(messages)
+            model_info = get_model(model_name)
         
-        logger.info(
-            f"Bedrock API Call | model={model_name} ({model_info.model_id}), "
-            f"messages={len(messages)}, temp={temperature}, max_tokens={max_tokens}"
+        logger.debug(
+            "Bedrock API Call | model=%s (%s), messages=%d, temp=%s, max_tokens=%d",
+            model_name, model_info.model_id, len(messages), temperature, max_tokens
         )
         
-        # Convert to Bedrock format
-        system_prompt, conversation = self._convert_messages_to_bedrock_format(
-            messages, 
-            supports_system=model_info.supports_system
+        converse_params = self._build_converse_params(
+            model_info, messages, temperature, max_tokens, cache_prefix
         )
         
         try:
-            # Prepare converse parameters
-            converse_params = {
-                "modelId": model_info.model_id,
-                "messages": conversation,
-                "inferenceConfig": {
-                    "temperature": temperature,
-                    "maxTokens": min(max_tokens, model_info.max_tokens)  # Respect model limits
-                }
-            }
-            
-            # Add system prompt if supported and present
-            if system_prompt and model_info.supports_system:
-                converse_params["system"] = [{"text": system_prompt}]
-            
-            # Call Bedrock Converse API
-            response = self.client.converse(**converse_params)
+            # Call Bedrock Converse API from a worker thread so the blocking
+            # boto3 round-trip doesn't stall other requests on the event loop
+            response = await self._run(partial(self.client.converse, **converse_params))
             
             # Extract response
-            output_message = response["output"]["message"]
-            content = output_message["content"][0]["text"]
+            content = response["output"]["message"]["content"][0]["text"]
             
-            # Extract usage
-            usage = response.get("usage", {})
-            input_tokens = usage.get("inputTokens", 0)
-            output_tokens = usage.get("outputTokens", 0)
-            total_tokens = usage.get("totalTokens", input_tokens + output_tokens)
+            # Extract usage (always present in Converse responses)
+            usage = self._parse_usage(response.get("usage") or {})
             
             # Get finish reason
             finish_reason = response.get("stopReason", "stop")
             
-            logger.info(
-                f"Bedrock response | model={model_name}, tokens={total_tokens}, "
-                f"finish_reason={finish_reason}"
+            logger.debug(
+                "Bedrock response | model=%s, tokens=%d, cache_read_tokens=%d, "
+                "finish_reason=%s",
+                model_name, usage["total_tokens"], usage["cache_read_input_tokens"],
+                finish_reason
             )
             
             return {
                 "content": content,
-                "usage": {
-                    "input_tokens": input_tokens,
-                    "output_tokens": output_tokens,
-                    "total_tokens": total_tokens
-                },
+                "usage": usage,
                 "finish_reason": finish_reason,
                 "model": model_name,
                 "model_id": model_info.model_id
@@ -168,27 +274,166 @@ class BedrockClient:
             logger.error(f"Unexpected error calling Bedrock: {str(e)}")
             raise
     
-    def estimate_cost(self, model_name: str, input_tokens: int, output_tokens: int) -> float:
+    async def generate_stream(
+        self,
+        model_name: str,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        cache_prefix: bool = False,
+        model_info: Optional[BedrockModel] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream a response from any Bedrock model using the ConverseStream API.
+        
+        The blocking boto3 event stream is consumed from a worker thread so the
+        event loop stays free to forward chunks while the model is generating.
+        
+        Args:
+            model_name: Model short name (e.g., 'nova-pro', 'claude-3-5-sonnet')
+            messages: List of message dictionaries
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            cache_prefix: Add Bedrock prompt cache checkpoints (supported models only)
+            model_info: Already-resolved, already-validated model metadata
+                (messages are validated and the model looked up if omitted)
+            
+        Yields:
+            {"delta": str, "done": False} for each text chunk, then a final
+            {"delta": "", "done": True, "response": {...}} where response has
+            the same shape as `generate()`
+            
+        Raises:
+            ValueError: If model not found
+            Exception: If API call fails
+        """
+        # Callers that pass model_info (the router) have already validated
+        if model_info is None:
+            validate_messages(messages)
+            model_info = get_model(model_name)
+        
+        logger.debug(
+            "Bedrock API Stream | model=%s (%s), messages=%d, temp=%s, max_tokens=%d",
+            model_name, model_info.model_id, len(messages), temperature, max_tokens
+        )
+        
+        converse_params = self._build_converse_params(
+            model_info, messages, temperature, max_tokens, cache_prefix
+        )
+        
+        stream = None
+        try:
+            response = await self._run(
+                partial(self.client.converse_stream, **converse_params)
+            )
+            stream = response["stream"]
+            events = iter(stream)
+            
+            parts = []
+            usage = {}
+            finish_reason = "stop"
+            
+            while True:
+                event = await self._run(partial(next, events, None))
+                if event is None:
+                    break
+                
+                if "contentBlockDelta" in event:
+                    text = event["contentBlockDelta"]["delta"].get("text")
+                    if text:
+                        parts.append(text)
+                        yield {"delta": text, "done": False}
+                elif "messageStop" in event:
+                    finish_reason = event["messageStop"].get("stopReason", "stop")
+                elif "metadata" in event:
+                    usage = event["metadata"].get("usage", {})
+            
+            usage = self._parse_usage(usage)
+            
+            logger.debug(
+                "Bedrock stream complete | model=%s, tokens=%d, cache_read_tokens=%d, "
+                "finish_reason=%s",
+                model_name, usage["total_tokens"], usage["cache_read_input_tokens"],
+                finish_reason
+            )
+            
+            yield {
+                "delta": "",
+                "done": True,
+                "response": {
+                    "content": "".join(parts),
+                    "usage": usage,
+                    "finish_reason": finish_reason,
+                    "model": model_name,
+                    "model_id": model_info.model_id
+                }
+            }
+            
+        except ClientError as e:
+            error_code = e.response["Error"]["Code"]
+            error_message = e.response["Error"]["Message"]
+            logger.error(f"Bedrock API error: {error_code} - {error_message}")
+            raise Exception(f"Bedrock error ({model_name}): {error_code} - {error_message}")
+        
+        except Exception as e:
+            logger.error(f"Unexpected error streaming from Bedrock: {str(e)}")
+            raise
+        
+        finally:
+            # Release the HTTP connection if the consumer stopped early
+            if stream is not None:
+                stream.close()
+    
+    def estimate_cost(
+        self,
+        model_name: str,
+        input_tokens: int,
+        output_tokens: int,
+        cache_read_tokens: int = 0,
+        cache_write_tokens: int = 0,
+        model_info: Optional[BedrockModel] = None
+    ) -> float:
         """Estimate cost for a Bedrock model.
         
+        Prompt cache reads are billed at 10% of the input price; cache writes
+        are billed at the input price times the model's `cache_write_multiplier`
+        (1.25 for Claude, 1.0 for Nova).
+        
         Args:
             model_name: Model short name
-            input_tokens: Number of input tokens
+            input_tokens: Number of (uncached) input tokens
             output_tokens: Number of output tokens
+            cache_read_tokens: Number of input tokens read from the prompt cache
+            cache_write_tokens: Number of input tokens written to the prompt cache
+            model_info: Already-resolved model metadata (looked up by name if omitted)
             
         Returns:
             Estimated cost in USD
         """
-        model_info = get_model(model_name)
-        
-        input_cost = (input_tokens / 1000) * model_info.input_cost_per_1k
-        output_cost = (output_tokens / 1000) * model_info.output_cost_per_1k
+        if model_info is None:
+            model_info = get_model(model_name)
+        input_price = model_info.input_cost_per_token
         
-        return input_cost + output_cost
+        return (
+            (
+                input_tokens
+                + cache_write_tokens * model_info.cache_write_multiplier
+                + cache_read_tokens * 0.1
+            ) * input_price
+            + output_tokens * model_info.output_cost_per_token
+        )
 
 
-# Singleton instance
-bedrock_client = BedrockClient()
+@lru_cache(maxsize=None)
+def get_bedrock_client() -> BedrockClient:
+    """Get the shared Bedrock client, creating it on first use.
+    
+    Building the boto3 client loads botocore's service model, so it is
+    deferred until the first request instead of happening at import time.
+    
+    Returns:
+        Singleton BedrockClient instance
+    """
+    return BedrockClient()
 
 
-__all__ = ["BedrockClient", "bedrock_client"]
+__all__ = ["BedrockClient", "get_bedrock_client"]
@@ -12,11 +12,25 @@ class Settings(BaseSettings):
     AWS_SECRET_ACCESS_KEY: Optional[str] = None
     AWS_REGION: str = "us-east-1"
     
+    # Bedrock HTTP connection pool (concurrent calls sharing warm TLS connections)
+    BEDROCK_POOL_SIZE: int = 64
+    
     # Cache configuration
     CACHE_ENABLED: bool = True
     CACHE_TTL: int = 3600  # 1 hour in seconds
     CACHE_MAX_SIZE: int = 1000  # Maximum number of cached items
     
+    # Semantic cache (needs sentence-transformers + faiss-cpu)
+    SEMANTIC_CACHE_ENABLED: bool = False
+    SEMANTIC_CACHE_MODEL: str = "all-MiniLM-L6-v2"
+    SEMANTIC_CACHE_THRESHOLD: float = 0.87  # Minimum cosine similarity for a hit
+    SEMANTIC_CACHE_MAX_TEMPERATURE: float = 0.3  # Only cache near-deterministic requests
+    SEMANTIC_CACHE_MAX_SIZE: int = 10000  # Maximum cached responses per model/max_tokens/system prompt
+    EMBEDDING_CACHE_SIZE: int = 4096  # Prompt embeddings kept to skip re-encoding
+    
+    # Streaming configuration
+    STREAM_FLUSH_INTERVAL_MS: int = 100  # Micro-batching window for streamed chunks
+    
     # Metrics configuration
     METRICS_ENABLED: bool = True
     
@@ -1,12 +1,15 @@
 """Core business logic module."""
 
 from .cache import CacheManager, cache_manager
+from .semantic_cache import SemanticCache, semantic_cache_manager
 from .metrics import LLMMetrics, MetricsManager, metrics_manager
 from .router import ModelRouter
 
 __all__ = [
     "CacheManager",
     "cache_manager",
+    "SemanticCache",
+    "semantic_cache_manager",
     "LLMMetrics",
     "MetricsManager",
     "metrics_manager",
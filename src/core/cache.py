@@ -1,13 +1,13 @@
 """Simple in-memory cache system using TTLCache."""
 
 import hashlib
-import json
 import logging
 from typing import Any, Optional
 from cachetools import TTLCache
 import threading
 
 from ..config import settings
+from ..utils import jsonio
 
 logger = logging.getLogger(__name__)
 
@@ -27,7 +27,7 @@ class CacheManager:
         self.enabled = settings.CACHE_ENABLED
         logger.info(f"Cache initialized: enabled={self.enabled}, maxsize={maxsize}, ttl={ttl}s")
     
-    def _generate_key(self, model: str, messages: list, **kwargs) -> str:
+    def make_key(self, model: str, messages: list, **kwargs) -> bytes:
         """Generate a unique cache key from request parameters.
         
         Args:
@@ -36,18 +36,54 @@ class CacheManager:
             **kwargs: Additional parameters (temperature, max_tokens, etc)
             
         Returns:
-            MD5 hash as cache key
+            16-byte BLAKE2b digest as cache key
         """
         # Create deterministic representation
         cache_data = {
             "model": model,
             "messages": messages,
-            "params": {k: v for k, v in sorted(kwargs.items())}
+            "params": kwargs
         }
         
         # Generate hash
-        data_string = json.dumps(cache_data, sort_keys=True)
-        return hashlib.md5(data_string.encode()).hexdigest()
+        return hashlib.blake2b(
+            jsonio.dumps(cache_data, sort_keys=True), digest_size=16
+        ).digest()
+    
+    def get_by_key(self, key: bytes) -> Optional[dict]:
+        """Retrieve cached response for a precomputed key.
+        
+        Args:
+            key: Cache key from `make_key`
+            
+        Returns:
+            Cached response or None if not found
+        """
+        if not self.enabled:
+            return None
+        
+        with self.lock:
+            value = self.cache.get(key)
+        
+        if value:
+            logger.debug("Cache HIT key=%s...", key[:4].hex())
+        else:
+            logger.debug("Cache MISS key=%s...", key[:4].hex())
+        return value
+    
+    def set_by_key(self, key: bytes, response: dict) -> None:
+        """Store response under a precomputed key.
+        
+        Args:
+            key: Cache key from `make_key`
+            response: Response to cache
+        """
+        if not self.enabled:
+            return
+        
+        with self.lock:
+            self.cache[key] = response
+        logger.debug("Cached response, key=%s...", key[:4].hex())
     
     def get(self, model: str, messages: list, **kwargs) -> Optional[dict]:
         """Retrieve cached response if available.
@@ -63,15 +99,7 @@ class CacheManager:
         if not self.enabled:
             return None
         
-        key = self._generate_key(model, messages, **kwargs)
-        
-        with self.lock:
-            value = self.cache.get(key)
-            if value:
-                logger.info(f"Cache HIT for model={model}, key={key[:8]}...")
-            else:
-                logger.debug(f"Cache MISS for model={model}, key={key[:8]}...")
-            return value
+        return self.get_by_key(self.make_key(model, messages, **kwargs))
     
     def set(self, model: str, messages: list, response: dict, **kwargs) -> None:
         """Store response in cache.
@@ -85,11 +113,7 @@ class CacheManager:
         if not self.enabled:
             return
         
-        key = self._generate_key(model, messages, **kwargs)
-        
-        with self.lock:
-            self.cache[key] = response
-            logger.debug(f"Cached response for model={model}, key={key[:8]}...")
+        self.set_by_key(self.make_key(model, messages, **kwargs), response)
     
     def clear(self) -> None:
         """Clear all cached items."""
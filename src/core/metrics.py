@@ -2,8 +2,9 @@
 
 import logging
 import threading
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Dict, List
+from typing import Deque, Dict, List
 from datetime import datetime
 
 from ..config import settings
@@ -67,8 +68,8 @@ class LLMMetrics:
         self.cost_by_model[model] = self.cost_by_model.get(model, 0.0) + cost
         
         logger.debug(
-            f"Metrics recorded: model={model}, tokens={tokens}, "
-            f"cost=${cost:.4f}, latency={latency:.2f}ms, cached={cached}"
+            "Metrics recorded: model=%s, tokens=%d, cost=$%.4f, latency=%.2fms, cached=%s",
+            model, tokens, cost, latency, cached
         )
     
     def get_stats(self) -> dict:
@@ -92,8 +93,8 @@ class LLMMetrics:
             "cache_misses": self.cache_misses,
             "cache_hit_rate_percent": round(cache_hit_rate, 2),
             "average_latency_ms": round(avg_latency, 2),
-            "requests_by_model": self.requests_by_model,
-            "tokens_by_model": self.tokens_by_model,
+            "requests_by_model": dict(self.requests_by_model),
+            "tokens_by_model": dict(self.tokens_by_model),
             "cost_by_model": {k: round(v, 4) for k, v in self.cost_by_model.items()},
             "last_reset": self.last_reset.isoformat()
         }
@@ -115,12 +116,21 @@ class LLMMetrics:
 
 
 class MetricsManager:
-    """Thread-safe metrics manager."""
+    """Thread-safe metrics manager.
+    
+    Requests only append to a pending queue (deque appends are atomic), so
+    the request path never waits on the lock. Pending events are folded into
+    the totals in batches: when the queue reaches `FLUSH_THRESHOLD`, and
+    before stats are read.
+    """
+    
+    FLUSH_THRESHOLD = 256
     
     def __init__(self):
         self.metrics = LLMMetrics()
         self.lock = threading.Lock()
         self.enabled = settings.METRICS_ENABLED
+        self._pending: Deque[tuple] = deque()
         logger.info(f"Metrics initialized: enabled={self.enabled}")
     
     def record(
@@ -132,21 +142,32 @@ class MetricsManager:
         cached: bool,
         error: bool = False
     ) -> None:
-        """Thread-safe record of metrics."""
+        """Queue a request's metrics (applied in batches)."""
         if not self.enabled:
             return
         
-        with self.lock:
-            self.metrics.record_request(model, tokens, cost, latency, cached, error)
+        self._pending.append((model, tokens, cost, latency, cached, error))
+        
+        if len(self._pending) >= self.FLUSH_THRESHOLD:
+            with self.lock:
+                self._flush()
+    
+    def _flush(self) -> None:
+        """Apply pending events to the metrics. Caller must hold the lock."""
+        pending = self._pending
+        while pending:
+            self.metrics.record_request(*pending.popleft())
     
     def get_stats(self) -> dict:
         """Thread-safe retrieval of stats."""
         with self.lock:
+            self._flush()
             return self.metrics.get_stats()
     
     def reset(self) -> None:
         """Thread-safe reset of metrics."""
         with self.lock:
+            self._pending.clear()
             self.metrics.reset()
 
 
@@ -1,9 +1,10 @@
 """Model routing logic for LLM Gateway - Routes to Bedrock models."""
 
+import asyncio
 import time
-from typing import Dict, Any
-from ..bedrock.bedrock_client import bedrock_client
-from ..models.bedrock_models import BEDROCK_MODELS
+from typing import Dict, Any, AsyncIterator, Optional
+from ..bedrock.bedrock_client import get_bedrock_client
+from ..models.bedrock_models import BEDROCK_MODELS, BedrockModel
 from ..utils.logger import get_logger
 from ..utils.validators import validate_messages, validate_temperature, validate_max_tokens
 
@@ -13,30 +14,109 @@ logger = get_logger(__name__)
 class ModelRouter:
     """Routes requests to appropriate LLM providers with caching and metrics."""
     
-    def __init__(self, cache_manager=None, metrics_manager=None):
+    def __init__(self, cache_manager=None, metrics_manager=None, semantic_cache_manager=None):
         """Initialize router with optional cache and metrics managers.
         
         Args:
             cache_manager: Cache manager instance
             metrics_manager: Metrics manager instance
+            semantic_cache_manager: Semantic cache instance (similar-prompt lookups)
         """
         self.cache_manager = cache_manager
         self.metrics_manager = metrics_manager
+        self.semantic_cache_manager = semantic_cache_manager
         logger.info("ModelRouter initialized")
     
+    def _validate(
+        self,
+        model: str,
+        messages: list,
+        temperature: float,
+        max_tokens: int
+    ) -> BedrockModel:
+        """Validate request inputs and resolve the model.
+        
+        Returns:
+            BedrockModel metadata, passed on to the Bedrock client so the
+            catalog is looked up once per request
+        
+        Raises:
+            ValueError: If validation fails or model not found
+        """
+        validate_messages(messages)
+        validate_temperature(temperature)
+        validate_max_tokens(max_tokens)
+        
+        model_info = BEDROCK_MODELS.get(model)
+        if model_info is None:
+            available = ', '.join(BEDROCK_MODELS.keys())
+            raise ValueError(
+                f"Model '{model}' not found. Available models: {available}"
+            )
+        
+        return model_info
+    
+    def _make_cache_key(
+        self,
+        model: str,
+        messages: list,
+        temperature: float,
+        max_tokens: int
+    ) -> Optional[bytes]:
+        """Build the exact-match cache key for a request.
+        
+        Runs before validation, so inputs that can't be serialized (e.g. an
+        integer too large for orjson) are treated as a cache miss and
+        validation reports the actual error.
+        
+        Returns:
+            Cache key, or None if the cache is disabled or the key can't be built
+        """
+        if not (self.cache_manager and self.cache_manager.enabled):
+            return None
+        
+        try:
+            return self.cache_manager.make_key(
+                model=model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens
+            )
+        except (TypeError, ValueError):
+            return None
+    
+    def _record_error(self, model: str, start_ns: int) -> None:
+        """Record a failed request in the metrics.
+        
+        Args:
+            model: Model name requested
+            start_ns: perf_counter_ns() value when the request started
+        """
+        if self.metrics_manager:
+            self.metrics_manager.record(
+                model=model,
+                tokens=0,
+                cost=0.0,
+                latency=(time.perf_counter_ns() - start_ns) / 1_000_000,
+                cached=False,
+                error=True
+            )
+    
     async def route_request(
         self,
         model: str,
         messages: list,
         temperature: float = 0.7,
         max_tokens: int = 2000,
+        cache_prefix: bool = False,
         **kwargs
     ) -> Dict[str, Any]:
         """Route a request to the appropriate LLM provider.
         
         This is the main entry point for all LLM requests. It handles:
-        - Validation
         - Cache checking
+        - Validation (on cache miss)
+        - Semantic cache checking (low-temperature requests, when enabled)
         - Provider routing
         - Metrics recording
         - Error handling
@@ -46,6 +126,7 @@ class ModelRouter:
             messages: List of conversation messages
             temperature: Sampling temperature (0.0-2.0)
             max_tokens: Maximum tokens to generate
+            cache_prefix: Add Bedrock prompt cache checkpoints (supported models only)
             **kwargs: Additional provider-specific parameters
             
         Returns:
@@ -56,7 +137,9 @@ class ModelRouter:
                 "usage": {
                     "input_tokens": int,
                     "output_tokens": int,
-                    "total_tokens": int
+                    "total_tokens": int,
+                    "cache_read_input_tokens": int,
+                    "cache_write_input_tokens": int
                 },
                 "finish_reason": str,
                 "cached": bool,
@@ -68,76 +151,92 @@ class ModelRouter:
             ValueError: If validation fails or model not found
             Exception: If generation fails
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         cached = False
+        bedrock_client = get_bedrock_client()
+        
+        model_info = None  # resolved by _validate on a cache miss
         
         try:
-            # Validate inputs
-            validate_messages(messages)
-            validate_temperature(temperature)
-            validate_max_tokens(max_tokens)
-            
-            if model not in BEDROCK_MODELS:
-                available = ', '.join(BEDROCK_MODELS.keys())
-                raise ValueError(
-                    f"Model '{model}' not found. Available models: {available}"
-                )
-            
-            logger.info(
-                f"Routing request | model={model}, messages={len(messages)}, "
-                f"temp={temperature}, max_tokens={max_tokens}"
-            )
-            
-            # Check cache
+            # Check cache first: only validated requests are ever cached, so a
+            # hit means these exact inputs already passed validation
             cached_response = None
-            if self.cache_manager:
-                cached_response = self.cache_manager.get(
-                    model=model,
-                    messages=messages,
-                    temperature=temperature,
-                    max_tokens=max_tokens
-                )
+            # Canonicalize once; the same key is reused to store on a miss
+            cache_key = self._make_cache_key(model, messages, temperature, max_tokens)
+            if cache_key is not None:
+                cached_response = self.cache_manager.get_by_key(cache_key)
             
             if cached_response:
                 cached = True
                 response_data = cached_response
-                logger.info(f"✓ Cache hit for model={model}")
+                logger.debug("✓ Cache hit for model=%s", model)
             else:
-                # Call Bedrock with the specified model
-                logger.info(f"🔀 Routing to Bedrock model: {model}")
+                # Validate inputs
+                model_info = self._validate(model, messages, temperature, max_tokens)
                 
-                response_data = await bedrock_client.generate(
-                    model_name=model,
-                    messages=messages,
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                    **kwargs
-                )
-                
-                logger.info(
-                    f"✓ Provider response: Bedrock - "
-                    f"tokens={response_data['usage']['total_tokens']}"
-                )
+                # Look for a paraphrase of an earlier request (embedding is CPU-bound)
+                semantic_vector = None
+                if self.semantic_cache_manager and self.semantic_cache_manager.accepts(temperature):
+                    semantic_partition = self.semantic_cache_manager.partition_key(
+                        model, messages, max_tokens
+                    )
+                    semantic_vector = await asyncio.to_thread(
+                        self.semantic_cache_manager.embed, messages
+                    )
+                    cached_response = self.semantic_cache_manager.get_by_vector(
+                        semantic_partition, semantic_vector
+                    )
                 
-                # Cache the response
-                if self.cache_manager:
-                    self.cache_manager.set(
-                        model=model,
+                if cached_response:
+                    cached = True
+                    response_data = cached_response
+                    logger.debug("✓ Semantic cache hit for model=%s", model)
+                else:
+                    logger.debug(
+                        "Routing request | model=%s, messages=%d, temp=%s, max_tokens=%d",
+                        model, len(messages), temperature, max_tokens
+                    )
+                    
+                    # Call Bedrock with the specified model
+                    logger.debug("🔀 Routing to Bedrock model: %s", model)
+                    
+                    response_data = await bedrock_client.generate(
+                        model_name=model,
                         messages=messages,
-                        response=response_data,
                         temperature=temperature,
-                        max_tokens=max_tokens
+                        max_tokens=max_tokens,
+                        cache_prefix=cache_prefix,
+                        model_info=model_info,
+                        **kwargs
+                    )
+                    
+                    logger.debug(
+                        "✓ Provider response: Bedrock - tokens=%d",
+                        response_data["usage"]["total_tokens"]
                     )
+                    
+                    # Truncated answers are not reused for other prompts
+                    if semantic_vector is not None and response_data["finish_reason"] != "max_tokens":
+                        self.semantic_cache_manager.set_by_vector(
+                            semantic_partition, semantic_vector, response_data
+                        )
+                
+                # Cache the response
+                if cache_key is not None:
+                    self.cache_manager.set_by_key(cache_key, response_data)
             
             # Calculate metrics
-            latency_ms = (time.time() - start_time) * 1000
+            latency_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
             usage = response_data["usage"]
             
             # Estimate cost using Bedrock client
             estimated_cost = bedrock_client.estimate_cost(
                 model,
                 usage["input_tokens"],
-                usage["output_tokens"]
+                usage["output_tokens"],
+                usage.get("cache_read_input_tokens", 0),
+                usage.get("cache_write_input_tokens", 0),
+                model_info=model_info
             )
             
             # Record metrics
@@ -150,9 +249,9 @@ class ModelRouter:
                     cached=cached
                 )
             
-            logger.info(
-                f"Request complete | model={model}, tokens={usage['total_tokens']}, "
-                f"cost=${estimated_cost:.4f}, latency={latency_ms:.2f}ms, cached={cached}"
+            logger.debug(
+                "Request complete | model=%s, tokens=%d, cost=$%.4f, latency=%.2fms, cached=%s",
+                model, usage["total_tokens"], estimated_cost, latency_ms, cached
             )
             
             # Return enriched response
@@ -168,34 +267,140 @@ class ModelRouter:
             
         except ValueError as e:
             # Validation or model not found error
-            latency_ms = (time.time() - start_time) * 1000
             logger.error(f"Validation error: {str(e)}")
-            
-            if self.metrics_manager:
-                self.metrics_manager.record(
-                    model=model,
-                    tokens=0,
-                    cost=0.0,
-                    latency=latency_ms,
-                    cached=False,
-                    error=True
-                )
+            self._record_error(model, start_ns)
             
             raise
         
         except Exception as e:
             # Provider or unexpected error
-            latency_ms = (time.time() - start_time) * 1000
             logger.error(f"Error routing request: {str(e)}", exc_info=True)
+            self._record_error(model, start_ns)
+            
+            raise Exception(f"Failed to generate response: {str(e)}")
+    
+    async def route_stream_request(
+        self,
+        model: str,
+        messages: list,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        cache_prefix: bool = False
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Route a streaming request to Bedrock with caching and metrics.
+        
+        Same validation, caching and metrics as `route_request`, but text is
+        yielded as soon as Bedrock produces it. A cache hit is replayed as a
+        single chunk.
+        
+        Args:
+            model: Model name to use
+            messages: List of conversation messages
+            temperature: Sampling temperature (0.0-2.0)
+            max_tokens: Maximum tokens to generate
+            cache_prefix: Add Bedrock prompt cache checkpoints (supported models only)
+            
+        Yields:
+            {"delta": str, "done": False} for each text chunk, then a final
+            {"delta": "", "done": True, "response": {...}} where response has
+            the same shape as the `route_request` return value
+            
+        Raises:
+            ValueError: If validation fails or model not found
+            Exception: If generation fails
+        """
+        start_ns = time.perf_counter_ns()
+        cached = False
+        bedrock_client = get_bedrock_client()
+        
+        model_info = None  # resolved by _validate on a cache miss
+        
+        try:
+            cached_response = None
+            # Canonicalize once; the same key is reused to store on a miss
+            cache_key = self._make_cache_key(model, messages, temperature, max_tokens)
+            if cache_key is not None:
+                cached_response = self.cache_manager.get_by_key(cache_key)
+            
+            if cached_response:
+                cached = True
+                response_data = cached_response
+                logger.debug("✓ Cache hit for model=%s", model)
+                yield {"delta": response_data["content"], "done": False}
+            else:
+                model_info = self._validate(model, messages, temperature, max_tokens)
+                
+                logger.debug(
+                    "Routing stream request | model=%s, messages=%d, temp=%s, max_tokens=%d",
+                    model, len(messages), temperature, max_tokens
+                )
+                logger.debug("🔀 Streaming from Bedrock model: %s", model)
+                
+                response_data = None
+                async for event in bedrock_client.generate_stream(
+                    model_name=model,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    cache_prefix=cache_prefix,
+                    model_info=model_info
+                ):
+                    if event["done"]:
+                        response_data = event["response"]
+                    else:
+                        yield event
+                
+                if cache_key is not None:
+                    self.cache_manager.set_by_key(cache_key, response_data)
+            
+            latency_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+            usage = response_data["usage"]
+            
+            estimated_cost = bedrock_client.estimate_cost(
+                model,
+                usage["input_tokens"],
+                usage["output_tokens"],
+                usage.get("cache_read_input_tokens", 0),
+                usage.get("cache_write_input_tokens", 0),
+                model_info=model_info
+            )
             
             if self.metrics_manager:
                 self.metrics_manager.record(
                     model=model,
-                    tokens=0,
-                    cost=0.0,
+                    tokens=usage["total_tokens"],
+                    cost=estimated_cost,
                     latency=latency_ms,
-                    cached=False,
-                    error=True
+                    cached=cached
                 )
             
-            raise Exception(f"Failed to generate response: {str(e)}")
+            logger.debug(
+                "Stream complete | model=%s, tokens=%d, cost=$%.4f, latency=%.2fms, cached=%s",
+                model, usage["total_tokens"], estimated_cost, latency_ms, cached
+            )
+            
+            yield {
+                "delta": "",
+                "done": True,
+                "response": {
+                    "content": response_data["content"],
+                    "model": response_data["model"],
+                    "usage": usage,
+                    "finish_reason": response_data["finish_reason"],
+                    "cached": cached,
+                    "latency_ms": round(latency_ms, 2),
+                    "estimated_cost_usd": round(estimated_cost, 6)
+                }
+            }
+            
+        except ValueError as e:
+            logger.error(f"Validation error: {str(e)}")
+            self._record_error(model, start_ns)
+            
+            raise
+        
+        except Exception as e:
+            logger.error(f"Error routing stream request: {str(e)}", exc_info=True)
+            self._record_error(model, start_ns)
+            
+            raise Exception(f"Failed to stream response: {str(e)}")
@@ -0,0 +1,273 @@
+"""Semantic (similarity-based) response cache using sentence embeddings.
+
+Complements the exact-match CacheManager: prompts that are paraphrases of an
+earlier request (cosine similarity above a threshold) reuse its completion
+instead of calling Bedrock again.
+
+Requires the optional `sentence-transformers` and `faiss-cpu` packages; the
+cache stays disabled when they are not installed.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+from cachetools import LRUCache
+
+from ..config import settings
+
+try:
+    import faiss
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+    SEMANTIC_CACHE_AVAILABLE = True
+except ImportError:
+    SEMANTIC_CACHE_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+class SemanticCache:
+    """Thread-safe semantic cache with one FAISS index per partition.
+    
+    A partition groups requests that may share answers: same model, same
+    max_tokens and same system prompt (see `partition_key`). Embeddings are
+    L2-normalized, so inner product search over an `IndexFlatIP` gives
+    cosine similarity directly.
+    """
+    
+    def __init__(
+        self,
+        model_name: str = "all-MiniLM-L6-v2",
+        threshold: float = 0.87,
+        max_temperature: float = 0.3,
+        max_entries: int = 10000,
+        embedding_cache_size: int = 4096,
+        ttl: int = 3600
+    ):
+        """Initialize semantic cache.
+        
+        Args:
+            model_name: sentence-transformers model used for embeddings
+            threshold: Minimum cosine similarity for a hit
+            max_temperature: Only requests at or below this temperature are cached
+            max_entries: Maximum cached responses per partition
+            embedding_cache_size: Number of prompt embeddings kept in memory
+            ttl: Time to live of cached responses in seconds
+        """
+        self.model_name = model_name
+        self.threshold = threshold
+        self.max_temperature = max_temperature
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.enabled = settings.SEMANTIC_CACHE_ENABLED and SEMANTIC_CACHE_AVAILABLE
+        self.lock = threading.Lock()
+        
+        # Embedding model is loaded on first use
+        self._encoder = None
+        self._encoder_lock = threading.Lock()
+        
+        # Recent prompt embeddings, so repeated prompts skip the model
+        self._embeddings = LRUCache(maxsize=embedding_cache_size)
+        
+        # Per-partition index and the (insertion time, response) pairs stored
+        # in the same order, so expired entries are always a prefix
+        self._indexes: Dict[Hashable, Any] = {}
+        self._responses: Dict[Hashable, List[Tuple[float, dict]]] = {}
+        
+        if settings.SEMANTIC_CACHE_ENABLED and not SEMANTIC_CACHE_AVAILABLE:
+            logger.warning(
+                "Semantic cache requested but sentence-transformers/faiss are not "
+                "installed. Install with: pip install sentence-transformers faiss-cpu"
+            )
+        
+        logger.info(
+            f"Semantic cache initialized: enabled={self.enabled}, "
+            f"model={model_name}, threshold={threshold}"
+        )
+    
+    def accepts(self, temperature: float) -> bool:
+        """Whether a request with this temperature can use the semantic cache.
+        
+        Args:
+            temperature: Request sampling temperature
+        
+        Returns:
+            True if enabled and the request is close to deterministic
+        """
+        return self.enabled and temperature <= self.max_temperature
+    
+    @staticmethod
+    def partition_key(model: str, messages: list, max_tokens: int) -> tuple:
+        """Build the partition a request is looked up and stored in.
+        
+        Only the conversation text is compared by similarity; the model,
+        max_tokens and system prompt must match exactly, so an answer
+        generated under a smaller token limit or different instructions is
+        never served.
+        
+        Args:
+            model: Model name
+            messages: List of message dictionaries
+            max_tokens: Requested maximum tokens
+        
+        Returns:
+            Hashable partition key
+        """
+        system = "\n".join(msg["content"] for msg in messages if msg["role"] == "system")
+        return (model, max_tokens, system)
+    
+    def _get_encoder(self):
+        """Load the embedding model once (thread-safe)."""
+        if self._encoder is None:
+            with self._encoder_lock:
+                if self._encoder is None:
+                    logger.info(f"Loading embedding model: {self.model_name}")
+                    self._encoder = SentenceTransformer(self.model_name)
+        return self._encoder
+    
+    def embed(self, messages: list) -> Any:
+        """Embed a conversation as a single normalized vector.
+        
+        CPU-bound; call from a worker thread when on the event loop.
+        
+        Args:
+            messages: List of message dictionaries
+        
+        Returns:
+            float32 array of shape (1, dim)
+        """
+        prompt = "\n".join(f"{msg['role']}:{msg['content']}" for msg in messages)
+        
+        with self.lock:
+            vector = self._embeddings.get(prompt)
+        if vector is not None:
+            return vector
+        
+        vector = np.asarray(
+            self._get_encoder().encode(
+                [prompt],
+                normalize_embeddings=True,
+                convert_to_numpy=True
+            ),
+            dtype=np.float32
+        )
+        vector.setflags(write=False)  # shared between requests
+        
+        with self.lock:
+            self._embeddings[prompt] = vector
+        return vector
+    
+    def get_by_vector(self, partition: tuple, vector: Any) -> Optional[dict]:
+        """Find the most similar cached response in a partition.
+        
+        Args:
+            partition: Key from `partition_key`
+            vector: Embedding from `embed`
+        
+        Returns:
+            Cached response or None if nothing is similar enough
+        """
+        if not self.enabled:
+            return None
+        
+        with self.lock:
+            index = self._indexes.get(partition)
+            if index is None or index.ntotal == 0:
+                return None
+            
+            scores, ids = index.search(vector, 1)
+            score = float(scores[0][0])
+            if score < self.threshold:
+                logger.debug("Semantic cache MISS for model=%s, score=%.3f", partition[0], score)
+                return None
+            
+            stored_at, response = self._responses[partition][int(ids[0][0])]
+            if time.monotonic() - stored_at > self.ttl:
+                self._evict_expired(partition)
+                logger.debug("Semantic cache EXPIRED for model=%s", partition[0])
+                return None
+        
+        logger.debug("Semantic cache HIT for model=%s, score=%.3f", partition[0], score)
+        return response
+    
+    def _evict_expired(self, partition: tuple) -> None:
+        """Drop a partition's expired entries (caller holds the lock).
+        
+        Entries are appended in insertion order, so the expired ones are the
+        leading run; removing a range from a flat index keeps the remaining
+        ids aligned with the response list.
+        """
+        responses = self._responses[partition]
+        cutoff = time.monotonic() - self.ttl
+        expired = 0
+        while expired < len(responses) and responses[expired][0] < cutoff:
+            expired += 1
+        
+        if expired:
+            self._indexes[partition].remove_ids(faiss.IDSelectorRange(0, expired))
+            del responses[:expired]
+    
+    def set_by_vector(self, partition: tuple, vector: Any, response: dict) -> None:
+        """Store a response under its embedding.
+        
+        Args:
+            partition: Key from `partition_key`
+            vector: Embedding from `embed`
+            response: Response to cache
+        """
+        if not self.enabled:
+            return
+        
+        with self.lock:
+            index = self._indexes.get(partition)
+            if index is None:
+                index = faiss.IndexFlatIP(vector.shape[1])
+                self._indexes[partition] = index
+                self._responses[partition] = []
+            elif index.ntotal >= self.max_entries:
+                # Flat indexes can't evict single entries; start over for this partition
+                index.reset()
+                self._responses[partition].clear()
+                logger.info(f"Semantic cache full for model={partition[0]}, cleared")
+            else:
+                self._evict_expired(partition)
+            
+            index.add(vector)
+            self._responses[partition].append((time.monotonic(), response))
+    
+    def clear(self) -> None:
+        """Clear all cached items."""
+        with self.lock:
+            self._indexes.clear()
+            self._responses.clear()
+            self._embeddings.clear()
+            logger.info("Semantic cache cleared")
+    
+    def get_stats(self) -> dict:
+        """Get semantic cache statistics.
+        
+        Returns:
+            Dictionary with semantic cache stats
+        """
+        with self.lock:
+            return {
+                "enabled": self.enabled,
+                "current_size": sum(len(r) for r in self._responses.values()),
+                "max_size_per_partition": self.max_entries,
+                "embeddings_cached": len(self._embeddings),
+                "threshold": self.threshold,
+                "ttl_seconds": self.ttl,
+                "max_temperature": self.max_temperature
+            }
+
+
+# Singleton instance
+semantic_cache_manager = SemanticCache(
+    model_name=settings.SEMANTIC_CACHE_MODEL,
+    threshold=settings.SEMANTIC_CACHE_THRESHOLD,
+    max_temperature=settings.SEMANTIC_CACHE_MAX_TEMPERATURE,
+    max_entries=settings.SEMANTIC_CACHE_MAX_SIZE,
+    embedding_cache_size=settings.EMBEDDING_CACHE_SIZE,
+    ttl=settings.CACHE_TTL
+)
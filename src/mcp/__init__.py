@@ -2,6 +2,7 @@
 
 from .tools import (
     generate_completion,
+    generate_completion_stream,
     list_available_models,
     get_gateway_stats,
     router
@@ -9,6 +10,7 @@ from .tools import (
 
 __all__ = [
     "generate_completion",
+    "generate_completion_stream",
     "list_available_models",
     "get_gateway_stats",
     "router",
@@ -1,8 +1,15 @@
 """MCP Tools for LLM Gateway - Interface for external agents."""
 
-from typing import List, Dict, Any
+import copy
+import logging
+import threading
+import time
+from typing import List, Dict, Any, AsyncIterator
+from cachetools import TTLCache
+from ..config import settings
 from ..core.router import ModelRouter
 from ..core.cache import cache_manager
+from ..core.semantic_cache import semantic_cache_manager
 from ..core.metrics import metrics_manager
 from ..models.bedrock_models import BEDROCK_MODELS, list_all_models
 from ..utils.logger import get_logger
@@ -12,15 +19,21 @@ logger = get_logger(__name__)
 # Initialize router with cache and metrics
 router = ModelRouter(
     cache_manager=cache_manager,
-    metrics_manager=metrics_manager
+    metrics_manager=metrics_manager,
+    semantic_cache_manager=semantic_cache_manager
 )
 
+# Stats snapshot reused for 1s, so frequent polling doesn't rebuild it every time
+_stats_cache = TTLCache(maxsize=1, ttl=1.0)
+_stats_lock = threading.Lock()
+
 
 async def generate_completion(
     model: str,
     messages: List[Dict[str, str]],
     temperature: float = 0.7,
-    max_tokens: int = 2000
+    max_tokens: int = 2000,
+    cache_prefix: bool = True
 ) -> Dict[str, Any]:
     """Generate LLM completion - Main entry point for all agents.
     
@@ -34,6 +47,8 @@ async def generate_completion(
                   Example: [{"role": "user", "content": "Hello!"}]
         temperature: Sampling temperature for randomness (0.0-2.0, default: 0.7)
         max_tokens: Maximum tokens to generate (default: 2000)
+        cache_prefix: Mark the conversation prefix for Bedrock prompt caching
+                      on models that support it (default: True)
     
     Returns:
         Dictionary with generated content and metadata:
@@ -43,7 +58,9 @@ async def generate_completion(
             "usage": {
                 "input_tokens": 10,
                 "output_tokens": 50,
-                "total_tokens": 60
+                "total_tokens": 60,
+                "cache_read_input_tokens": 0,
+                "cache_write_input_tokens": 0
             },
             "finish_reason": "stop",
             "cached": false,
@@ -68,20 +85,24 @@ async def generate_completion(
         print(response["content"])
         ```
     """
-    logger.info(
-        f"MCP Tool called: generate_completion | model={model}, "
-        f"messages={len(messages)}, temp={temperature}, max_tokens={max_tokens}"
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "MCP Tool called: generate_completion | model=%s, messages=%d, temp=%s, max_tokens=%d",
+            model, len(messages), temperature, max_tokens
+        )
     
     try:
         result = await router.route_request(
             model=model,
             messages=messages,
             temperature=temperature,
-            max_tokens=max_tokens
+            max_tokens=max_tokens,
+            cache_prefix=cache_prefix
         )
         
-        logger.info(f"MCP Tool success | model={model}, tokens={result['usage']['total_tokens']}")
+        logger.info(
+            "MCP Tool success | model=%s, tokens=%d", model, result["usage"]["total_tokens"]
+        )
         return result
         
     except Exception as e:
@@ -89,6 +110,76 @@ async def generate_completion(
         raise
 
 
+async def generate_completion_stream(
+    model: str,
+    messages: List[Dict[str, str]],
+    temperature: float = 0.7,
+    max_tokens: int = 2000,
+    cache_prefix: bool = True
+) -> AsyncIterator[Dict[str, Any]]:
+    """Stream an LLM completion in micro-batched chunks.
+    
+    Text produced by Bedrock is grouped into chunks of at most
+    STREAM_FLUSH_INTERVAL_MS so consumers are not flooded with one message
+    per token. The first chunk is delivered as soon as it arrives.
+    
+    Args:
+        model: Bedrock model identifier (e.g., 'nova-pro', 'claude-3-5-sonnet')
+        messages: List of conversation messages with 'role' and 'content'
+        temperature: Sampling temperature for randomness (0.0-2.0, default: 0.7)
+        max_tokens: Maximum tokens to generate (default: 2000)
+        cache_prefix: Mark the conversation prefix for Bedrock prompt caching
+                      on models that support it (default: True)
+    
+    Yields:
+        {"delta": str, "done": False} for each chunk, then
+        {"delta": "", "done": True, "response": {...}} where response has the
+        same shape as the `generate_completion` result
+    
+    Raises:
+        ValueError: If parameters are invalid or model not found
+        Exception: If generation fails
+    """
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "MCP Tool called: generate_completion_stream | model=%s, messages=%d, temp=%s, max_tokens=%d",
+            model, len(messages), temperature, max_tokens
+        )
+    
+    flush_interval = settings.STREAM_FLUSH_INTERVAL_MS / 1000
+    buffer: List[str] = []
+    last_flush = 0.0
+    
+    try:
+        async for event in router.route_stream_request(
+            model=model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            cache_prefix=cache_prefix
+        ):
+            if event["done"]:
+                if buffer:
+                    yield {"delta": "".join(buffer), "done": False}
+                logger.info(
+                    "MCP Tool success | model=%s, tokens=%d",
+                    model, event["response"]["usage"]["total_tokens"]
+                )
+                yield event
+                continue
+            
+            buffer.append(event["delta"])
+            now = time.monotonic()
+            if now - last_flush >= flush_interval:
+                yield {"delta": "".join(buffer), "done": False}
+                buffer.clear()
+                last_flush = now
+        
+    except Exception as e:
+        logger.error(f"MCP Tool error: {str(e)}")
+        raise
+
+
 def list_available_models() -> List[Dict[str, Any]]:
     """List all available Bedrock foundation models and their metadata.
     
@@ -119,11 +210,12 @@ def list_available_models() -> List[Dict[str, Any]]:
             print(f"  Cost: ${model['input_cost_per_1k']}/1K input, ${model['output_cost_per_1k']}/1K output")
         ```
     """
-    logger.info("MCP Tool called: list_available_models")
+    logger.debug("MCP Tool called: list_available_models")
     
     models = list_all_models()
     
-    logger.info(f"MCP Tool success | listed {len(models)} Bedrock models")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("MCP Tool success | listed %d Bedrock models", len(models))
     return models
 
 
@@ -131,6 +223,7 @@ def get_gateway_stats() -> Dict[str, Any]:
     """Get current gateway statistics including metrics and cache info.
     
     Useful for monitoring the gateway's performance, costs, and cache efficiency.
+    Results are reused for up to one second.
     
     Returns:
         Dictionary with metrics and cache statistics:
@@ -147,6 +240,11 @@ def get_gateway_stats() -> Dict[str, Any]:
                 "size": 50,
                 "max_size": 1000,
                 "hit_rate_percent": 45.5
+            },
+            "semantic_cache": {
+                "enabled": false,
+                "current_size": 0,
+                ...
             }
         }
     
@@ -157,15 +255,21 @@ def get_gateway_stats() -> Dict[str, Any]:
         print(f"Cache hit rate: {stats['metrics']['cache_hit_rate_percent']}%")
         ```
     """
-    logger.info("MCP Tool called: get_gateway_stats")
+    logger.debug("MCP Tool called: get_gateway_stats")
     
     try:
-        stats = {
-            "metrics": metrics_manager.get_stats(),
-            "cache": cache_manager.get_stats()
-        }
-        logger.info("MCP Tool success | retrieved gateway stats")
-        return stats
+        with _stats_lock:
+            stats = _stats_cache.get("stats")
+            if stats is None:
+                stats = {
+                    "metrics": metrics_manager.get_stats(),
+                    "cache": cache_manager.get_stats(),
+                    "semantic_cache": semantic_cache_manager.get_stats()
+                }
+                _stats_cache["stats"] = stats
+        logger.debug("MCP Tool success | retrieved gateway stats")
+        # Callers get their own copy; the cached snapshot is shared for 1s
+        return copy.deepcopy(stats)
         
     except Exception as e:
         logger.error(f"Error getting stats: {str(e)}")
@@ -175,6 +279,7 @@ def get_gateway_stats() -> Dict[str, Any]:
 # Export tools for MCP server registration
 __all__ = [
     "generate_completion",
+    "generate_completion_stream",
     "list_available_models",
     "get_gateway_stats",
     "router"
@@ -3,6 +3,7 @@
 from .bedrock_models import (
     BedrockModel,
     BEDROCK_MODELS,
+    BEDROCK_MODEL_NAMES,
     get_model,
     list_all_models
 )
@@ -10,6 +11,7 @@ from .bedrock_models import (
 __all__ = [
     "BedrockModel",
     "BEDROCK_MODELS",
+    "BEDROCK_MODEL_NAMES",
     "get_model",
     "list_all_models"
 ]
@@ -5,12 +5,12 @@ with their IDs, pricing, and capabilities.
 """
 
 from typing import Dict, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BedrockModel:
-    """Bedrock model metadata and pricing."""
+    """Bedrock model metadata and pricing (read-only reference data)."""
     
     model_id: str
     name: str
@@ -20,6 +20,17 @@ class BedrockModel:
     output_cost_per_1k: float  # USD per 1000 output tokens
     supports_system: bool = True
     max_tokens: int = 4096
+    supports_prompt_cache: bool = False  # Bedrock cachePoint support
+    prompt_cache_min_tokens: int = 1024  # Minimum tokens per cache checkpoint
+    cache_write_multiplier: float = 1.0  # Cache write price relative to input price
+    input_cost_per_token: float = field(init=False, repr=False)
+    output_cost_per_token: float = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        """Precompute per-token prices used by cost estimation."""
+        # Frozen dataclass: derived fields are set through object.__setattr__
+        object.__setattr__(self, "input_cost_per_token", self.input_cost_per_1k / 1000)
+        object.__setattr__(self, "output_cost_per_token", self.output_cost_per_1k / 1000)
 
 
 # Bedrock Foundation Models Catalog
@@ -33,7 +44,9 @@ BEDROCK_MODELS: Dict[str, BedrockModel] = {
         input_cost_per_1k=0.0008,
         output_cost_per_1k=0.0032,
         supports_system=True,
-        max_tokens=5000
+        max_tokens=5000,
+        supports_prompt_cache=True,
+        prompt_cache_min_tokens=1000
     ),
     "nova-lite": BedrockModel(
         model_id="us.amazon.nova-lite-v1:0",
@@ -43,7 +56,9 @@ BEDROCK_MODELS: Dict[str, BedrockModel] = {
         input_cost_per_1k=0.00006,
         output_cost_per_1k=0.00024,
         supports_system=True,
-        max_tokens=5000
+        max_tokens=5000,
+        supports_prompt_cache=True,
+        prompt_cache_min_tokens=1000
     ),
     "nova-micro": BedrockModel(
         model_id="us.amazon.nova-micro-v1:0",
@@ -53,7 +68,9 @@ BEDROCK_MODELS: Dict[str, BedrockModel] = {
         input_cost_per_1k=0.000035,
         output_cost_per_1k=0.00014,
         supports_system=True,
-        max_tokens=5000
+        max_tokens=5000,
+        supports_prompt_cache=True,
+        prompt_cache_min_tokens=1000
     ),
     
     # Anthropic Claude Models
@@ -65,7 +82,8 @@ BEDROCK_MODELS: Dict[str, BedrockModel] = {
         input_cost_per_1k=0.003,
         output_cost_per_1k=0.015,
         supports_system=True,
-        max_tokens=8192
+        max_tokens=8192,
+        cache_write_multiplier=1.25
     ),
     "claude-3-5-haiku": BedrockModel(
         model_id="us.anthropic.claude-3-5-haiku-20241022-v1:0",
@@ -75,7 +93,10 @@ BEDROCK_MODELS: Dict[str, BedrockModel] = {
         input_cost_per_1k=0.001,
         output_cost_per_1k=0.005,
         supports_system=True,
-        max_tokens=8192
+        max_tokens=8192,
+        supports_prompt_cache=True,
+        prompt_cache_min_tokens=2048,
+        cache_write_multiplier=1.25
     ),
     "claude-3-opus": BedrockModel(
         model_id="anthropic.claude-3-opus-20240229-v1:0",
@@ -85,7 +106,8 @@ BEDROCK_MODELS: Dict[str, BedrockModel] = {
         input_cost_per_1k=0.015,
         output_cost_per_1k=0.075,
         supports_system=True,
-        max_tokens=4096
+        max_tokens=4096,
+        cache_write_multiplier=1.25
     ),
     "claude-3-sonnet": BedrockModel(
         model_id="anthropic.claude-3-sonnet-20240229-v1:0",
@@ -95,7 +117,8 @@ BEDROCK_MODELS: Dict[str, BedrockModel] = {
         input_cost_per_1k=0.003,
         output_cost_per_1k=0.015,
         supports_system=True,
-        max_tokens=4096
+        max_tokens=4096,
+        cache_write_multiplier=1.25
     ),
     "claude-3-haiku": BedrockModel(
         model_id="anthropic.claude-3-haiku-20240307-v1:0",
@@ -105,7 +128,8 @@ BEDROCK_MODELS: Dict[str, BedrockModel] = {
         input_cost_per_1k=0.00025,
         output_cost_per_1k=0.00125,
         supports_system=True,
-        max_tokens=4096
+        max_tokens=4096,
+        cache_write_multiplier=1.25
     ),
     
     # Meta Llama Models
@@ -184,6 +208,10 @@ BEDROCK_MODELS: Dict[str, BedrockModel] = {
 }
 
 
+# Bound lookup: a single hash on hits instead of `in` check + subscript
+_lookup_model = BEDROCK_MODELS.__getitem__
+
+
 def get_model(model_name: str) -> BedrockModel:
     """Get Bedrock model by name.
     
@@ -196,37 +224,50 @@ def get_model(model_name: str) -> BedrockModel:
     Raises:
         ValueError: If model not found
     """
-    if model_name not in BEDROCK_MODELS:
+    try:
+        return _lookup_model(model_name)
+    except KeyError:
         available = ", ".join(BEDROCK_MODELS.keys())
-        raise ValueError(f"Model '{model_name}' not found. Available: {available}")
-    
-    return BEDROCK_MODELS[model_name]
+        raise ValueError(f"Model '{model_name}' not found. Available: {available}") from None
+
+
+# Model names, for O(1) membership checks
+BEDROCK_MODEL_NAMES: frozenset[str] = frozenset(BEDROCK_MODELS)
+
+
+# Catalog payload for list_models, built once (BEDROCK_MODELS doesn't change at runtime)
+_MODELS_SNAPSHOT: tuple[Dict[str, Any], ...] = tuple(
+    {
+        "name": name,
+        "model_id": model.model_id,
+        "description": model.description,
+        "context_window": model.context_window,
+        "input_cost_per_1k": model.input_cost_per_1k,
+        "output_cost_per_1k": model.output_cost_per_1k,
+        "supports_system": model.supports_system,
+        "max_tokens": model.max_tokens,
+        "supports_prompt_cache": model.supports_prompt_cache
+    }
+    for name, model in BEDROCK_MODELS.items()
+)
 
 
 def list_all_models() -> list[Dict[str, Any]]:
     """List all available Bedrock models.
     
+    The metadata dictionaries are shared between calls and must not be
+    modified by callers.
+    
     Returns:
         List of model metadata dictionaries
     """
-    return [
-        {
-            "name": name,
-            "model_id": model.model_id,
-            "description": model.description,
-            "context_window": model.context_window,
-            "input_cost_per_1k": model.input_cost_per_1k,
-            "output_cost_per_1k": model.output_cost_per_1k,
-            "supports_system": model.supports_system,
-            "max_tokens": model.max_tokens
-        }
-        for name, model in BEDROCK_MODELS.items()
-    ]
+    return list(_MODELS_SNAPSHOT)
 
 
 __all__ = [
     "BedrockModel",
     "BEDROCK_MODELS",
+    "BEDROCK_MODEL_NAMES",
     "get_model",
     "list_all_models"
 ]
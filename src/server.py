@@ -7,14 +7,16 @@ allowing external AI workflows and agents to communicate with various LLM provid
 Production deployment uses FastAPI + HTTP/SSE transport for remote access.
 """
 
+import logging
 from typing import List, Dict, Any
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastmcp import FastMCP
+from fastmcp import FastMCP, Context
 
 from .config import settings
 from .mcp.tools import (
     generate_completion,
+    generate_completion_stream,
     list_available_models,
     get_gateway_stats
 )
@@ -23,6 +25,9 @@ from .models.bedrock_models import BEDROCK_MODELS
 
 # Configure logging
 logger = setup_logger("llm-gateway", level=settings.LOG_LEVEL)
+# Package modules (src.mcp.tools, src.core.router, src.bedrock...) log under
+# "src"; without a handler their INFO lines would be dropped
+setup_logger(__package__, level=settings.LOG_LEVEL)
 
 # Initialize FastMCP server
 mcp = FastMCP(
@@ -31,104 +36,67 @@ mcp = FastMCP(
 )
 
 
+# Tools backed directly by src/mcp/tools.py are registered without a
+# forwarding wrapper, so each call runs a single coroutine (or none)
+mcp.tool(name="generate")(generate_completion)
+mcp.tool(name="list_models")(list_available_models)
+mcp.tool(name="get_stats")(get_gateway_stats)
+
+
 @mcp.tool()
-async def generate(
+async def generate_stream(
     model: str,
     messages: List[Dict[str, str]],
     temperature: float = 0.7,
-    max_tokens: int = 2000
+    max_tokens: int = 2000,
+    cache_prefix: bool = True,
+    ctx: Context = None
 ) -> Dict[str, Any]:
-    """Generate LLM completion - Main entry point for all agents.
+    """Generate LLM completion, streaming text chunks as progress notifications.
     
-    This is the primary tool that external workflows/agents use to communicate
-    with the LLM Gateway. It handles routing to different Bedrock foundation models
-    and returns standardized responses with metrics.
+    Each chunk of generated text is sent to the caller as an MCP progress
+    notification (`message` carries the text, `progress` the characters
+    received so far). The tool result is the same dictionary `generate` returns.
     
     Args:
         model: Bedrock model name (e.g., 'nova-pro', 'claude-3-5-sonnet', 'llama-3-3-70b')
         messages: List of conversation messages with 'role' and 'content'
-                  Example: [{"role": "user", "content": "Hello!"}]
         temperature: Sampling temperature for randomness (0.0-2.0, default: 0.7)
         max_tokens: Maximum tokens to generate (default: 2000)
+        cache_prefix: Mark the conversation prefix for Bedrock prompt caching
+                      on models that support it (default: True)
     
     Returns:
         Dictionary with generated content and metadata including usage, cost, latency
-    
-    Example:
-        ```python
-        response = await generate(
-            model="nova-pro",
-            messages=[{"role": "user", "content": "What is AI?"}],
-            temperature=0.7,
-            max_tokens=500
-        )
-        print(response["content"])
-        ```
     """
-    logger.info(f"MCP Tool: generate called | model={model}, messages={len(messages)}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "MCP Tool: generate_stream called | model=%s, messages=%d", model, len(messages)
+        )
+    
+    result = None
+    received = 0
     
-    result = await generate_completion(
+    async for event in generate_completion_stream(
         model=model,
         messages=messages,
         temperature=temperature,
-        max_tokens=max_tokens
+        max_tokens=max_tokens,
+        cache_prefix=cache_prefix
+    ):
+        if event["done"]:
+            result = event["response"]
+        else:
+            received += len(event["delta"])
+            if ctx is not None:
+                await ctx.report_progress(progress=received, message=event["delta"])
+    
+    logger.info(
+        "MCP Tool: generate_stream success | tokens=%d", result["usage"]["total_tokens"]
     )
-    
-    logger.info(f"MCP Tool: generate success | tokens={result['usage']['total_tokens']}")
     return result
 
 
-@mcp.tool()
-async def list_models() -> List[Dict[str, Any]]:
-    """List all available Bedrock foundation models and their metadata.
-    
-    Returns information about all Bedrock models registered in the gateway,
-    including their full model IDs, pricing, capabilities, and descriptions.
-    
-    Returns:
-        List of model metadata dictionaries
-    
-    Example:
-        ```python
-        models = await list_models()
-        for model in models:
-            print(f"{model['name']}: {model['description']}")
-            print(f"  Input: ${model['input_cost_per_1k']}/1K tokens")
-            print(f"  Output: ${model['output_cost_per_1k']}/1K tokens")
-        ```
-    """
-    logger.info("MCP Tool: list_models called")
-    
-    models = list_available_models()
-    
-    logger.info(f"MCP Tool: list_models success | count={len(models)}")
-    return models
-
-
-@mcp.tool()
-async def get_stats() -> Dict[str, Any]:
-    """Get current gateway statistics including metrics and cache info.
-    
-    Useful for monitoring the gateway's performance, costs, and cache efficiency.
-    
-    Returns:
-        Dictionary with metrics and cache statistics
-    
-    Example:
-        ```python
-        stats = await get_stats()
-        print(f"Total cost: ${stats['metrics']['total_cost_usd']}")
-        print(f"Cache hit rate: {stats['metrics']['cache_hit_rate_percent']}%")
-        ```
-    """
-    logger.info("MCP Tool: get_stats called")
-    
-    stats = get_gateway_stats()
-    
-    logger.info("MCP Tool: get_stats success")
-    return stats
-
-
 # Create FastAPI application
 app = FastAPI(
     title="Bedrock Gateway",
@@ -179,6 +147,6 @@ async def startup_event():
     logger.info(f"Cache enabled: {settings.CACHE_ENABLED}")
     logger.info(f"Metrics enabled: {settings.METRICS_ENABLED}")
     logger.info(f"Available Bedrock models: {len(BEDROCK_MODELS)}")
-    logger.info(f"Registered tools: generate, list_models, get_stats")
+    logger.info(f"Registered tools: generate, generate_stream, list_models, get_stats")
     logger.info(f"MCP endpoint: /mcp/sse")
     logger.info("=" * 60)
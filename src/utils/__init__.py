@@ -1,6 +1,7 @@
 """Utilities module."""
 
 from .logger import setup_logger, get_logger
+from . import jsonio
 from .validators import (
     validate_messages,
     validate_temperature,
@@ -11,6 +12,7 @@ from .validators import (
 __all__ = [
     "setup_logger",
     "get_logger",
+    "jsonio",
     "validate_messages",
     "validate_temperature",
     "validate_max_tokens",
@@ -0,0 +1,35 @@
+"""JSON serialization helpers - uses orjson when installed, stdlib json otherwise."""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps(obj: Any, sort_keys: bool = False) -> bytes:
+    """Serialize an object to compact JSON bytes.
+    
+    Args:
+        obj: JSON-serializable object
+        sort_keys: Sort dictionary keys (for deterministic output)
+        
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else 0)
+    
+    return json.dumps(
+        obj, sort_keys=sort_keys, separators=(",", ":"), ensure_ascii=False
+    ).encode()
+
+
+# Parse JSON from str or bytes
+loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+
+__all__ = ["dumps", "loads", "ORJSON_AVAILABLE"]
@@ -1,9 +1,67 @@
 """Centralized logging configuration for LLM Gateway."""
 
+import atexit
 import logging
+import queue
 import sys
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
 
+# One queue and one writer thread shared by every configured logger, so
+# lines from different loggers reach stderr in the order they were logged
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_listener: Optional[QueueListener] = None
+_listener_lock = threading.Lock()
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that reuses the formatted date/time within the same second.
+    
+    Output matches the default `%(asctime)s` ("YYYY-MM-DD HH:MM:SS,mmm"), but
+    `localtime()` + `strftime()` only run once per second instead of per record.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (second, formatted prefix) swapped as one tuple: records are
+        # formatted on the logging threads, so both must change together
+        self._cached = (-1, "")
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        
+        second = int(record.created)
+        cached_second, prefix = self._cached
+        if second != cached_second:
+            prefix = time.strftime(self.default_time_format, self.converter(second))
+            self._cached = (second, prefix)
+        return self.default_msec_format % (prefix, record.msecs)
+
+
+def _start_listener() -> None:
+    """Start the shared writer thread on first use."""
+    global _listener
+    with _listener_lock:
+        if _listener is None:
+            # Para MCP stdio, escribir logs a stderr (no stdout)
+            # stdout está reservado para mensajes JSON del protocolo MCP
+            # Records arrive already formatted by each logger's QueueHandler
+            _listener = QueueListener(_log_queue, logging.StreamHandler(sys.stderr))
+            _listener.start()
+
+
+@atexit.register
+def _stop_listener() -> None:
+    """Flush pending log records before the process exits."""
+    global _listener
+    with _listener_lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+
 
 def setup_logger(
     name: str,
@@ -12,6 +70,10 @@ def setup_logger(
 ) -> logging.Logger:
     """Setup and configure a logger instance.
     
+    Records are formatted with this logger's format, then handed to a queue
+    shared by all loggers and written to stderr by one background thread,
+    so request handlers don't block on console I/O.
+    
     Args:
         name: Logger name (usually __name__)
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
@@ -29,17 +91,15 @@ def setup_logger(
     
     # Avoid duplicate handlers
     if not logger.handlers:
-        # Para MCP stdio, escribir logs a stderr (no stdout)
-        # stdout está reservado para mensajes JSON del protocolo MCP
-        console_handler = logging.StreamHandler(sys.stderr)
-        console_handler.setLevel(getattr(logging, level.upper()))
+        _start_listener()
         
-        # Formatter
-        formatter = logging.Formatter(format_string)
-        console_handler.setFormatter(formatter)
+        # Queue records on the shared queue; the listener thread does the write
+        queue_handler = QueueHandler(_log_queue)
+        queue_handler.setLevel(getattr(logging, level.upper()))
+        queue_handler.setFormatter(_CachedTimeFormatter(format_string))
         
         # Add handler to logger
-        logger.addHandler(console_handler)
+        logger.addHandler(queue_handler)
     
     return logger
 
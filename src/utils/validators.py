@@ -1,6 +1,11 @@
 """Validation utilities for LLM Gateway."""
 
-from typing import List, Dict, Any
+from typing import Collection, List, Dict, Any
+
+# Roles accepted in chat messages
+VALID_ROLES = frozenset({"system", "user", "assistant"})
+
+_MISSING = object()
 
 
 def validate_messages(messages: List[Dict[str, str]]) -> None:
@@ -18,25 +23,31 @@ def validate_messages(messages: List[Dict[str, str]]) -> None:
     if not isinstance(messages, list):
         raise ValueError("Messages must be a list")
     
-    valid_roles = {"system", "user", "assistant"}
+    # Single pass with each field read once; locals avoid repeated global lookups
+    valid_roles = VALID_ROLES
+    is_instance = isinstance
     
     for i, msg in enumerate(messages):
-        if not isinstance(msg, dict):
+        if not is_instance(msg, dict):
             raise ValueError(f"Message {i} must be a dictionary")
         
-        if "role" not in msg or "content" not in msg:
+        role = msg.get("role", _MISSING)
+        content = msg.get("content", _MISSING)
+        
+        if role is _MISSING or content is _MISSING:
             raise ValueError(f"Message {i} must have 'role' and 'content' keys")
         
-        if msg["role"] not in valid_roles:
+        if role not in valid_roles:
             raise ValueError(
-                f"Message {i} has invalid role '{msg['role']}'. "
-                f"Must be one of: {valid_roles}"
+                f"Message {i} has invalid role '{role}'. "
+                f"Must be one of: {', '.join(sorted(valid_roles))}"
             )
         
-        if not isinstance(msg["content"], str):
+        if not is_instance(content, str):
             raise ValueError(f"Message {i} content must be a string")
         
-        if not msg["content"].strip():
+        # Empty or whitespace-only, without copying the content like strip() would
+        if not content or content.isspace():
             raise ValueError(f"Message {i} content cannot be empty")
 
 
@@ -75,12 +86,13 @@ def validate_max_tokens(max_tokens: int) -> None:
         raise ValueError("Max tokens cannot exceed 100000")
 
 
-def validate_model_name(model_name: str, available_models: List[str]) -> None:
+def validate_model_name(model_name: str, available_models: Collection[str]) -> None:
     """Validate model name against available models.
     
     Args:
         model_name: Model name to validate
-        available_models: List of available model names
+        available_models: Available model names (pass a set, e.g.
+            BEDROCK_MODEL_NAMES, for O(1) membership checks)
         
     Raises:
         ValueError: If model name is invalid
@@ -88,11 +100,11 @@ def validate_model_name(model_name: str, available_models: List[str]) -> None:
     if not isinstance(model_name, str):
         raise ValueError("Model name must be a string")
     
-    if not model_name.strip():
+    if not model_name or model_name.isspace():
         raise ValueError("Model name cannot be empty")
     
     if model_name not in available_models:
-        available = ", ".join(available_models)
+        available = ", ".join(sorted(available_models))
         raise ValueError(
             f"Model '{model_name}' not found. Available models: {available}"
         )